@@ -5,10 +5,168 @@ Generates detailed report for LoRa mesh network simulation results
 """
 
 import pandas as pd
+import numpy as np
 import os
+import glob
+import hashlib
 from datetime import datetime
 import sys
 import math
+import io
+import mmap
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import polars as pl  # optional: multi-threaded CSV parsing when installed
+except ImportError:
+    pl = None
+
+# Columns and dtypes actually consumed by the analysis; everything else in
+# paths.csv (currentNode, ttlAfterDecr, chosenVia, ...) is never read here
+CSV_COLUMNS = ['simTime', 'event', 'packetSeq', 'src', 'dst']
+CSV_DTYPES = {'src': 'int32', 'dst': 'int32', 'packetSeq': 'int64', 'simTime': 'float64'}
+
+# Full pandas parser config, built once; memory_map hands the C tokenizer an
+# mmap so repeated runs read straight from the warm page cache
+PATHS_READ_KW = dict(usecols=CSV_COLUMNS, dtype=CSV_DTYPES,
+                     engine='c', memory_map=True)
+
+# The analysis only ever reads these two event kinds (see the event split in
+# analyze_simulation_results); everything else is counted, then discarded
+KEPT_EVENTS = ['TX_SRC', 'DELIVERED']
+
+# End-node coordinate scalars, e.g.:
+#   scalar LoRaMesh.loRaEndNodes[0].LoRaNic.radio CordiX 120.5
+# Compiled once so every .sca scan is a single C-level pass over the bytes
+END_NODE_COORD_RE = re.compile(
+    rb'^scalar\s+\S*loRaEndNodes\[(\d+)\]\S*\s+(CordiX|CordiY|positionX|positionY)\s+(\S+)',
+    re.MULTILINE)
+
+def read_paths_csv(paths_csv_file):
+    """Parse paths.csv with Polars when available, falling back to pandas.
+
+    Polars tokenizes the CSV across all cores; the single to_pandas() at the
+    boundary keeps the rest of the analysis on the familiar pandas API.
+    Live CSVs can contain repeated header rows from appended runs (see
+    quick_view), which the strict dtype schema rejects — those files go
+    through a tolerant reparse that drops the stray rows and coerces back
+    to the same schema.
+    """
+    try:
+        if pl is not None:
+            df = pl.read_csv(paths_csv_file, columns=CSV_COLUMNS).to_pandas()
+        else:
+            df = pd.read_csv(paths_csv_file, **PATHS_READ_KW)
+    except Exception:
+        df = _read_paths_csv_tolerant(paths_csv_file)
+    df['event'] = df['event'].astype('category')
+    return df
+
+def _read_paths_csv_tolerant(paths_csv_file):
+    """Dtype-free reparse for live CSVs with appended header/garbage rows."""
+    df = pd.read_csv(paths_csv_file, usecols=CSV_COLUMNS,
+                     engine='c', memory_map=True)
+    coerced = {col: pd.to_numeric(df[col], errors='coerce')
+               for col in CSV_DTYPES}
+    valid = pd.concat(coerced, axis=1).notna().all(axis=1)
+    df = df.loc[valid].copy()
+    for col, dtype in CSV_DTYPES.items():
+        df[col] = coerced[col].loc[valid].astype(dtype)
+    return df
+
+def load_paths_events(paths_csv_file):
+    """Load paths.csv and return (total_events, node1000_packets).
+
+    Only the rows the analysis consumes — end node 1000's TX_SRC and
+    DELIVERED events — are kept in memory: the pandas path streams the CSV
+    in 250k-row chunks so multi-GB logs never hold the whole file at once,
+    and the Polars path filters before converting to pandas.
+
+    With FAST_IO=1 a Parquet sibling cache is used. The cache key hashes the
+    first 1 MB of the CSV plus its mtime, so a regenerated CSV never hits a
+    stale cache; siblings with an old key are removed.
+    """
+    if os.environ.get('FAST_IO') == '1':
+        with open(paths_csv_file, 'rb') as f:
+            head = f.read(1 << 20)
+        key = hashlib.blake2b(head + str(os.path.getmtime(paths_csv_file)).encode()).hexdigest()[:16]
+        cache_file = f"{paths_csv_file}.{key}.parquet"
+
+        if os.path.exists(cache_file):
+            df = pd.read_parquet(cache_file)
+        else:
+            df = read_paths_csv(paths_csv_file)
+            # Invalidate caches left over from older versions of this CSV
+            for stale in glob.glob(f"{paths_csv_file}.*.parquet"):
+                if stale != cache_file:
+                    try:
+                        os.remove(stale)
+                    except OSError:
+                        pass
+            try:
+                df.to_parquet(cache_file, compression='zstd')
+            except Exception as e:
+                print(f"Warning: Could not write Parquet cache {cache_file}: {e}")
+        return len(df), df[df['src'].to_numpy() == 1000]
+
+    if pl is not None:
+        df = pl.read_csv(paths_csv_file, columns=CSV_COLUMNS)
+        kept = df.filter((pl.col('src') == 1000)
+                         & pl.col('event').is_in(KEPT_EVENTS)).to_pandas()
+        kept['event'] = kept['event'].astype('category')
+        return df.height, kept
+
+    total_events = 0
+    kept = []
+    for chunk in pd.read_csv(paths_csv_file, chunksize=250_000, **PATHS_READ_KW):
+        total_events += len(chunk)
+        mask = (chunk['src'].to_numpy() == 1000) \
+            & chunk['event'].isin(KEPT_EVENTS).to_numpy()
+        kept.append(chunk[mask])
+    out = pd.concat(kept, ignore_index=True)
+    # Categorical event: downstream splits compare small int codes, not strings
+    out['event'] = out['event'].astype('category')
+    return total_events, out
+
+def _scan_sca_for_end_nodes(sca_file):
+    """Scan one .sca file; return partial {node_id: [x, y]} for 1000/1001.
+
+    mmap plus the compiled bytes pattern keeps the scan in C (and releases
+    the GIL there), so several files can be scanned concurrently. Stops at
+    the first point where both end nodes are fully located.
+    """
+    found = {}
+    try:
+        with open(sca_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for m in END_NODE_COORD_RE.finditer(mm):
+                # End nodes are indexed with a +1000 offset
+                node_id = 1000 + int(m.group(1))
+                if node_id not in (1000, 1001):
+                    continue
+
+                try:
+                    coord_val = float(m.group(3))
+                except ValueError:
+                    continue
+
+                if node_id not in found:
+                    found[node_id] = [None, None]
+                if m.group(2) in (b'CordiX', b'positionX'):
+                    found[node_id][0] = coord_val
+                else:
+                    found[node_id][1] = coord_val
+
+                # Both end nodes fully located: the rest of the file can
+                # never change the result
+                if (len(found) == 2
+                        and None not in found[1000]
+                        and None not in found[1001]):
+                    break
+    except Exception as inner_e:
+        print(f"Warning: Failed reading {sca_file}: {inner_e}")
+    return found
 
 def get_end_node_coordinates(simulations_dir="./"):
     """Extract end node coordinates from .sca result files.
@@ -27,54 +185,29 @@ def get_end_node_coordinates(simulations_dir="./"):
         if not sca_files:
             return coordinates
 
-        for sca_file in sca_files:
-            try:
-                with open(sca_file, 'r') as f:
-                    for line in f:
-                        if not line.startswith('scalar '):
-                            continue
-                        parts = line.strip().split()
-                        # Expected format: scalar <modulePath> <scalarName> <value>
-                        if len(parts) < 4:
-                            continue
-                        module_path = parts[1]
-                        scalar_name = parts[2]
-                        value_str = parts[3]
-                        if scalar_name not in ('CordiX', 'CordiY', 'positionX', 'positionY'):
-                            continue
-
-                        # Determine node id (end nodes indexed with +1000 offset)
-                        node_id = None
-                        if 'loRaEndNodes[' in module_path:
-                            # Extract index between brackets
-                            start = module_path.find('loRaEndNodes[') + len('loRaEndNodes[')
-                            end = module_path.find(']', start)
-                            if end != -1:
-                                try:
-                                    idx = int(module_path[start:end])
-                                    node_id = 1000 + idx
-                                except ValueError:
-                                    pass
-                        else:
-                            # Not an end node
-                            continue
-
-                        if node_id not in (1000, 1001):
-                            continue
-
-                        try:
-                            coord_val = float(value_str)
-                        except ValueError:
-                            continue
-
-                        if node_id not in coordinates:
-                            coordinates[node_id] = [None, None]
-                        if scalar_name in ('CordiX', 'positionX'):
-                            coordinates[node_id][0] = coord_val
-                        elif scalar_name in ('CordiY', 'positionY'):
-                            coordinates[node_id][1] = coord_val
-            except Exception as inner_e:
-                print(f"Warning: Failed reading {sca_file}: {inner_e}")
+        # Scan files concurrently: the mmap/regex work runs outside the GIL,
+        # so threads overlap both I/O and matching. Results merge in file
+        # order and the loop stops as soon as both nodes are located
+        if len(sca_files) == 1:
+            partials = map(_scan_sca_for_end_nodes, sca_files)
+        else:
+            executor = ThreadPoolExecutor(max_workers=min(8, len(sca_files)))
+            partials = executor.map(_scan_sca_for_end_nodes, sca_files)
+
+        for partial in partials:
+            for nid, (x, y) in partial.items():
+                slot = coordinates.setdefault(nid, [None, None])
+                if x is not None:
+                    slot[0] = x
+                if y is not None:
+                    slot[1] = y
+            if (len(coordinates) == 2
+                    and None not in coordinates[1000]
+                    and None not in coordinates[1001]):
+                break
+
+        if len(sca_files) > 1:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     except Exception as e:
         print(f"Warning: Could not scan results directory for .sca files: {e}")
@@ -96,7 +229,7 @@ def calculate_distance(coord1, coord2):
     
     dx = coord1[0] - coord2[0]
     dy = coord1[1] - coord2[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(dx, dy)
 
 def analyze_simulation_results(paths_csv_file="delivered_packets/paths.csv", output_file=None):
     """
@@ -112,18 +245,20 @@ def analyze_simulation_results(paths_csv_file="delivered_packets/paths.csv", out
         print(f"ERROR: {paths_csv_file} not found!")
         return
     
-    # Load data
+    # Load data (only end node 1000's rows are kept; the rest is just counted)
     try:
-        df = pd.read_csv(paths_csv_file)
-        print(f"Loaded {len(df)} events from {paths_csv_file}")
+        total_events, node1000_packets = load_paths_events(paths_csv_file)
+        print(f"Loaded {total_events} events from {paths_csv_file}")
     except Exception as e:
         print(f"ERROR loading CSV: {e}")
         return
     
+    # One timestamp serves both the default filename and the report header
+    now = datetime.now()
+
     # Generate output filename if not provided
     if output_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"simulation_analysis_report_{timestamp}.txt"
+        output_file = f"simulation_analysis_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
     
     # Start analysis
     print("Analyzing simulation results...")
@@ -139,257 +274,289 @@ def analyze_simulation_results(paths_csv_file="delivered_packets/paths.csv", out
         coord_1001 = coordinates[1001]
         end_node_distance = calculate_distance(coord_1000, coord_1001)
     
-    # Filter for end node 1000 packets (source node after ID offset)
-    node1000_packets = df[df['src'] == 1000]
-    
-    # Get transmission and delivery events for end node 1000 → 1001 communication
-    tx_events = node1000_packets[node1000_packets['event'] == 'TX_SRC']
-    delivery_events = df[(df['event'] == 'DELIVERED') & (df['src'] == 1000) & (df['dst'] == 1001)]
-    
+    # Split end node 1000's packets by event in a single groupby pass instead
+    # of one boolean mask per event
+    empty = node1000_packets.iloc[:0]
+    event_groups = {event: frame for event, frame
+                    in node1000_packets.groupby('event', sort=False, observed=True)}
+
+    # Transmission and delivery events for end node 1000 → 1001 communication
+    tx_events = event_groups.get('TX_SRC', empty)
+    delivered = event_groups.get('DELIVERED', empty)
+    delivery_events = delivered[delivered['dst'] == 1001]
+
+    # Materialize the transmission timestamps once as a zero-copy NumPy view;
+    # the timing and summary sections below all work on this array
+    tx_times = tx_events['simTime'].to_numpy(copy=False)
+
     # Basic statistics
     total_tx = len(tx_events)
     total_delivered = len(delivery_events)
     # Initialize variables used later to avoid UnboundLocalError when sections are skipped
     transit_times = []
-    transit_details = []
     time_intervals = None
     
-    # Prepare report content
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("LORA MESH NETWORK SIMULATION ANALYSIS REPORT")
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_lines.append(f"Data Source: {paths_csv_file}")
-    report_lines.append(f"Total Events Analyzed: {len(df)}")
+    # Prepare report content (compute the rules once, batch adjacent lines).
+    # Lines stream into a single StringIO buffer: no list of fragments, no
+    # final join pass, and one resizable allocation instead of thousands
+    rule = "=" * 80
+    section_rule = "-" * 50
+    buf = io.StringIO()
+    line_count = 0
+
+    def write_line(line):
+        nonlocal line_count
+        buf.write(line)
+        buf.write('\n')
+        line_count += 1
+
+    def write_batch(lines):
+        nonlocal line_count
+        buf.write('\n'.join(lines))
+        buf.write('\n')
+        line_count += len(lines)
+
+    write_batch([
+        rule,
+        "LORA MESH NETWORK SIMULATION ANALYSIS REPORT",
+        rule,
+        f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Data Source: {paths_csv_file}",
+        f"Total Events Analyzed: {total_events}",
+    ])
     
     # Add end node distance information
     if end_node_distance is not None:
-        report_lines.append(f"Distance between End Nodes 1000 and 1001: {end_node_distance:.2f} meters")
+        write_line(f"Distance between End Nodes 1000 and 1001: {end_node_distance:.2f} meters")
         if 1000 in coordinates and 1001 in coordinates:
             coord_1000 = coordinates[1000]
             coord_1001 = coordinates[1001]
-            report_lines.append(f"End Node 1000 position: ({coord_1000[0]:.2f}, {coord_1000[1]:.2f})")
-            report_lines.append(f"End Node 1001 position: ({coord_1001[0]:.2f}, {coord_1001[1]:.2f})")
+            write_line(f"End Node 1000 position: ({coord_1000[0]:.2f}, {coord_1000[1]:.2f})")
+            write_line(f"End Node 1001 position: ({coord_1001[0]:.2f}, {coord_1001[1]:.2f})")
     else:
-        report_lines.append("Distance between End Nodes: Not available")
-        report_lines.append("Note: End nodes use random circle deployment - coordinates not recorded in scalars")
-        report_lines.append("      Distance varies between simulation runs due to random placement")
+        write_line("Distance between End Nodes: Not available")
+        write_line("Note: End nodes use random circle deployment - coordinates not recorded in scalars")
+        write_line("      Distance varies between simulation runs due to random placement")
     
-    report_lines.append("")
+    write_line("")
     
     # 1. PACKET TRANSMISSION STATISTICS
-    report_lines.append("1. PACKET TRANSMISSION STATISTICS FROM END NODE 1000")
-    report_lines.append("-" * 50)
-    report_lines.append(f"Total data packets transmitted: {total_tx}")
+    write_batch([
+        "1. PACKET TRANSMISSION STATISTICS FROM END NODE 1000",
+        section_rule,
+        f"Total data packets transmitted: {total_tx}",
+    ])
     
     if total_tx > 0:
         # Packets per destination - expecting destination 1001 for end-to-end communication
         dest_counts = tx_events['dst'].value_counts().sort_index()
         unique_destinations = len(dest_counts)
         
-        report_lines.append(f"Number of unique destinations: {unique_destinations}")
-        report_lines.append(f"Expected destination for end-to-end test: 1001")
+        write_line(f"Number of unique destinations: {unique_destinations}")
+        write_line(f"Expected destination for end-to-end test: 1001")
         
         if 1001 in dest_counts.index:
-            report_lines.append("SUCCESS: Transmitted to expected destination (1001)")
+            write_line("SUCCESS: Transmitted to expected destination (1001)")
         else:
-            report_lines.append(f"WARNING: Expected destination 1001 not found in transmission list")
+            write_line(f"WARNING: Expected destination 1001 not found in transmission list")
         
-        report_lines.append("")
-        report_lines.append("Packets sent per destination:")
+        write_line("")
+        write_line("Packets sent per destination:")
         
-        # Group destinations for readable output
-        for i in range(0, len(dest_counts), 10):
-            chunk = dest_counts.iloc[i:i+10]
-            line_parts = []
-            for dest, count in chunk.items():
-                line_parts.append(f"Node {dest:2d}:{count}")
-            report_lines.append("  " + "  ".join(line_parts))
+        # Group destinations for readable output; slicing the raw ndarrays
+        # gives O(1) views instead of a new Series per row of ten
+        dests = dest_counts.index.to_numpy()
+        cnts = dest_counts.to_numpy()
+        for i in range(0, dests.size, 10):
+            write_line("  " + "  ".join(
+                f"Node {dest:2d}:{count}"
+                for dest, count in zip(dests[i:i+10], cnts[i:i+10])))
     
-    report_lines.append("")
+    write_line("")
     
     # 2. DELIVERY SUCCESS ANALYSIS
-    report_lines.append("2. DELIVERY SUCCESS RATE ANALYSIS")
-    report_lines.append("-" * 50)
-    report_lines.append(f"Total packets delivered: {total_delivered}")
+    write_batch([
+        "2. DELIVERY SUCCESS RATE ANALYSIS",
+        section_rule,
+        f"Total packets delivered: {total_delivered}",
+    ])
     
     if total_tx > 0:
         success_rate = (total_delivered / total_tx) * 100
-        report_lines.append(f"Overall delivery success rate: {success_rate:.2f}% ({total_delivered}/{total_tx})")
+        write_line(f"Overall delivery success rate: {success_rate:.2f}% ({total_delivered}/{total_tx})")
     else:
-        report_lines.append("No packets transmitted - cannot calculate success rate")
+        write_line("No packets transmitted - cannot calculate success rate")
     
     if total_delivered > 0:
-        delivered_destinations = set(delivery_events['dst'].unique())
-        reachable_count = len(delivered_destinations)
-        reachable_nodes = sorted(list(delivered_destinations))
+        # One value_counts pass yields the sorted unique destinations, their
+        # membership test and the per-destination delivery counts together
+        delivered_counts = delivery_events['dst'].value_counts().sort_index()
+        delivered_arr = delivered_counts.index.to_numpy()
+        reachable_count = delivered_arr.size
+        reachable_nodes = delivered_arr.tolist()
         
-        report_lines.append(f"Destinations that received packets: {reachable_count}")
-        if 1001 in delivered_destinations:
-            report_lines.append("SUCCESS: End node 1001 successfully received packets")
+        write_line(f"Destinations that received packets: {reachable_count}")
+        if 1001 in reachable_nodes:
+            write_line("SUCCESS: End node 1001 successfully received packets")
         else:
-            report_lines.append("WARNING: End node 1001 did not receive packets")
-        report_lines.append("")
+            write_line("WARNING: End node 1001 did not receive packets")
+        for dest, count in zip(reachable_nodes, delivered_counts.to_numpy()):
+            write_line(f"  Node {dest}: {count} delivered")
+        write_line("")
         
-        report_lines.append("REACHABLE NODES:")
+        write_line("REACHABLE NODES:")
         # Print reachable nodes in rows of 10
         for i in range(0, len(reachable_nodes), 10):
             chunk = reachable_nodes[i:i+10]
-            report_lines.append(f"  {chunk}")
+            write_line(f"  {chunk}")
         
         # Unreachable nodes
         if total_tx > 0:
-            transmitted_destinations = set(tx_events['dst'].unique())
-            unreachable_nodes = sorted(list(transmitted_destinations - delivered_destinations))
+            unreachable_nodes = np.setdiff1d(np.unique(tx_events['dst'].to_numpy()),
+                                             delivered_arr,
+                                             assume_unique=True).tolist()
             
             if unreachable_nodes:
-                report_lines.append("")
-                report_lines.append("UNREACHABLE NODES:")
+                write_line("")
+                write_line("UNREACHABLE NODES:")
                 for i in range(0, len(unreachable_nodes), 10):
                     chunk = unreachable_nodes[i:i+10]
-                    report_lines.append(f"  {chunk}")
+                    write_line(f"  {chunk}")
     
-    report_lines.append("")
+    write_line("")
     
     # 3. TRANSMISSION TIMING ANALYSIS
-    report_lines.append("3. TRANSMISSION TIMING ANALYSIS")
-    report_lines.append("-" * 50)
+    write_batch(["3. TRANSMISSION TIMING ANALYSIS", section_rule])
     
-    if len(tx_events) > 1:
-        tx_sorted = tx_events.sort_values('simTime')
-        time_intervals = tx_sorted['simTime'].diff().dropna()
-        
-        first_tx = tx_sorted.iloc[0]['simTime']
-        last_tx = tx_sorted.iloc[-1]['simTime']
+    if tx_times.size > 1:
+        # Sort the raw float64 array and diff it in NumPy; much cheaper than
+        # sort_values + Series.diff().dropna() on the whole frame
+        tx_times_sorted = np.sort(tx_times)
+        time_intervals = np.diff(tx_times_sorted)
+
+        first_tx = tx_times_sorted[0]
+        last_tx = tx_times_sorted[-1]
         total_duration = last_tx - first_tx
-        
-        report_lines.append(f"First transmission time: {first_tx:.3f} seconds")
-        report_lines.append(f"Last transmission time: {last_tx:.3f} seconds")
-        report_lines.append(f"Total transmission period: {total_duration:.3f} seconds")
-        report_lines.append("")
-        
-        report_lines.append("Time intervals between consecutive transmissions:")
-        report_lines.append(f"  Average interval: {time_intervals.mean():.3f} seconds")
-        report_lines.append(f"  Minimum interval: {time_intervals.min():.3f} seconds")
-        report_lines.append(f"  Maximum interval: {time_intervals.max():.3f} seconds")
-        report_lines.append(f"  Standard deviation: {time_intervals.std():.3f} seconds")
+
+        write_line(f"First transmission time: {first_tx:.3f} seconds")
+        write_line(f"Last transmission time: {last_tx:.3f} seconds")
+        write_line(f"Total transmission period: {total_duration:.3f} seconds")
+        write_line("")
+
+        write_line("Time intervals between consecutive transmissions:")
+        write_line(f"  Average interval: {time_intervals.mean():.3f} seconds")
+        write_line(f"  Minimum interval: {time_intervals.min():.3f} seconds")
+        write_line(f"  Maximum interval: {time_intervals.max():.3f} seconds")
+        write_line(f"  Standard deviation: {time_intervals.std(ddof=1):.3f} seconds")
     else:
-        report_lines.append("Insufficient transmission data for timing analysis")
+        write_line("Insufficient transmission data for timing analysis")
     
-    report_lines.append("")
+    write_line("")
     
     # 4. END-TO-END TRANSIT TIME ANALYSIS
-    report_lines.append("4. END-TO-END TRANSIT TIME ANALYSIS")
-    report_lines.append("-" * 50)
+    write_batch(["4. END-TO-END TRANSIT TIME ANALYSIS", section_rule])
     
     if total_delivered > 0 and total_tx > 0:
-        
-        # Calculate transit time for each delivered packet
-        for _, delivery in delivery_events.iterrows():
-            packet_seq = delivery['packetSeq']
-            dst_node = delivery['dst']
-            delivery_time = delivery['simTime']
-            
-            # Find corresponding transmission
-            tx_match = tx_events[tx_events['packetSeq'] == packet_seq]
-            
-            if len(tx_match) > 0:
-                tx_time = tx_match.iloc[0]['simTime']
-                transit_time = delivery_time - tx_time
-                transit_times.append(transit_time)
-                transit_details.append({
-                    'packet_seq': packet_seq,
-                    'destination': dst_node,
-                    'tx_time': tx_time,
-                    'delivery_time': delivery_time,
-                    'transit_time': transit_time
-                })
-        
+
+        # Match deliveries to their transmissions with a single hashed join instead of
+        # re-scanning tx_events once per delivered packet
+        matched = delivery_events[['packetSeq', 'dst', 'simTime']].merge(
+            tx_events[['packetSeq', 'simTime']].drop_duplicates('packetSeq'),
+            on='packetSeq', suffixes=('_dlv', '_tx'))
+        matched['transit_time'] = matched['simTime_dlv'] - matched['simTime_tx']
+        transit_times = matched['transit_time'].tolist()
+
         if transit_times:
-            report_lines.append(f"Successfully matched {len(transit_times)} packet journeys")
-            report_lines.append("")
-            report_lines.append("Transit time statistics:")
-            report_lines.append(f"  Average transit time: {sum(transit_times)/len(transit_times):.3f} seconds")
-            report_lines.append(f"  Minimum transit time: {min(transit_times):.3f} seconds")
-            report_lines.append(f"  Maximum transit time: {max(transit_times):.3f} seconds")
-            
-            # Find fastest and slowest deliveries
-            transit_details.sort(key=lambda x: x['transit_time'])
-            
-            fastest = transit_details[0]
-            slowest = transit_details[-1]
-            
-            report_lines.append("")
-            report_lines.append(f"FASTEST DELIVERY:")
-            report_lines.append(f"  Packet {fastest['packet_seq']} to Node {fastest['destination']}: {fastest['transit_time']:.3f}s")
-            
-            report_lines.append(f"SLOWEST DELIVERY:")
-            report_lines.append(f"  Packet {slowest['packet_seq']} to Node {slowest['destination']}: {slowest['transit_time']:.3f}s")
-            
+            write_batch([
+                f"Successfully matched {len(transit_times)} packet journeys",
+                "",
+                "Transit time statistics:",
+                f"  Average transit time: {matched['transit_time'].mean():.3f} seconds",
+                f"  Minimum transit time: {matched['transit_time'].min():.3f} seconds",
+                f"  Maximum transit time: {matched['transit_time'].max():.3f} seconds",
+            ])
+
+            # Find fastest and slowest deliveries (small partial sorts, not a full sort)
+            fastest5 = matched.nsmallest(5, 'transit_time')
+            slowest5 = matched.nlargest(5, 'transit_time').iloc[::-1]
+
+            fastest = fastest5.iloc[0]
+            slowest = slowest5.iloc[-1]
+
+            write_line("")
+            write_line(f"FASTEST DELIVERY:")
+            write_line(f"  Packet {int(fastest['packetSeq'])} to Node {int(fastest['dst'])}: {fastest['transit_time']:.3f}s")
+
+            write_line(f"SLOWEST DELIVERY:")
+            write_line(f"  Packet {int(slowest['packetSeq'])} to Node {int(slowest['dst'])}: {slowest['transit_time']:.3f}s")
+
             # Show top 5 fastest and slowest
-            report_lines.append("")
-            report_lines.append("Top 5 fastest deliveries:")
-            report_lines.append("  Seq  Dest  Transit Time")
-            for detail in transit_details[:5]:
-                report_lines.append(f"  {detail['packet_seq']:3d}  {detail['destination']:4d}  {detail['transit_time']:8.3f}s")
-            
-            report_lines.append("")
-            report_lines.append("Top 5 slowest deliveries:")
-            report_lines.append("  Seq  Dest  Transit Time")
-            for detail in transit_details[-5:]:
-                report_lines.append(f"  {detail['packet_seq']:3d}  {detail['destination']:4d}  {detail['transit_time']:8.3f}s")
+            write_line("")
+            write_line("Top 5 fastest deliveries:")
+            write_line("  Seq  Dest  Transit Time")
+            for detail in fastest5.itertuples(index=False):
+                write_line(f"  {detail.packetSeq:3d}  {detail.dst:4d}  {detail.transit_time:8.3f}s")
+
+            write_line("")
+            write_line("Top 5 slowest deliveries:")
+            write_line("  Seq  Dest  Transit Time")
+            for detail in slowest5.itertuples(index=False):
+                write_line(f"  {detail.packetSeq:3d}  {detail.dst:4d}  {detail.transit_time:8.3f}s")
         else:
-            report_lines.append("Could not match transmission and delivery events for transit time calculation")
+            write_line("Could not match transmission and delivery events for transit time calculation")
     else:
-        report_lines.append("No delivered packets - cannot calculate transit times")
+        write_line("No delivered packets - cannot calculate transit times")
     
-    report_lines.append("")
+    write_line("")
     
     # 5. SUMMARY AND RECOMMENDATIONS
-    report_lines.append("5. SUMMARY AND RECOMMENDATIONS")
-    report_lines.append("-" * 50)
+    write_batch(["5. SUMMARY AND RECOMMENDATIONS", section_rule])
     
     if total_tx > 0:
         if success_rate >= 80:
-            report_lines.append("EXCELLENT: High delivery success rate")
+            write_line("EXCELLENT: High delivery success rate")
         elif success_rate >= 50:
-            report_lines.append("GOOD: Moderate delivery success rate")
+            write_line("GOOD: Moderate delivery success rate")
         elif success_rate >= 20:
-            report_lines.append("FAIR: Low delivery success rate - investigate network issues")
+            write_line("FAIR: Low delivery success rate - investigate network issues")
         else:
-            report_lines.append("POOR: Very low delivery success rate - major network problems")
+            write_line("POOR: Very low delivery success rate - major network problems")
         
-        if len(tx_events) > 1 and time_intervals is not None:
+        if tx_times.size > 1 and time_intervals is not None:
             avg_interval = time_intervals.mean()
             if 8 <= avg_interval <= 12:
-                report_lines.append("TIMING: Transmission intervals within expected range (8-10s)")
+                write_line("TIMING: Transmission intervals within expected range (8-10s)")
             elif avg_interval < 2:
-                report_lines.append("TIMING WARNING: Very fast transmission intervals - may cause congestion")
+                write_line("TIMING WARNING: Very fast transmission intervals - may cause congestion")
             else:
-                report_lines.append(f"TIMING INFO: Transmission intervals: {avg_interval:.1f}s average")
+                write_line(f"TIMING INFO: Transmission intervals: {avg_interval:.1f}s average")
         
         if transit_times and len(transit_times) > 0:
             max_transit = max(transit_times)
             if max_transit < 10:
-                report_lines.append("LATENCY: Fast network response times")
+                write_line("LATENCY: Fast network response times")
             elif max_transit < 60:
-                report_lines.append("LATENCY: Reasonable network response times")
+                write_line("LATENCY: Reasonable network response times")
             else:
-                report_lines.append("LATENCY WARNING: High network latency detected")
+                write_line("LATENCY WARNING: High network latency detected")
     
-    report_lines.append("")
-    report_lines.append("=" * 80)
-    report_lines.append("END OF REPORT")
-    report_lines.append("=" * 80)
+    write_batch(["", rule, "END OF REPORT", rule])
     
     # Write report to file
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
-        
+        # Encode once and hand the bytes straight to the OS in one write,
+        # bypassing the TextIOWrapper layer (O_BINARY keeps Windows honest)
+        data = buf.getvalue().encode('utf-8')
+        fd = os.open(output_file,
+                     os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+                     0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
         print(f"✓ Analysis complete! Report saved to: {output_file}")
-        print(f"Report contains {len(report_lines)} lines")
+        print(f"Report contains {line_count} lines")
         
         # Print key summary to console
         print("\nKEY FINDINGS:")
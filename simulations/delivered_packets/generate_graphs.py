@@ -4,43 +4,69 @@ Generate comparison graphs for Smart Flooding vs Distance Vector routing
 """
 
 import csv
+import functools
+import os
+import sys
+import matplotlib
+matplotlib.use('Agg')  # raster-only backend: no GUI startup, faster PNG output
 import matplotlib.pyplot as plt
 import numpy as np
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Output resolution for saved figures; 150 DPI keeps the dashboards readable
+# at a quarter of the pixels (and rasterization cost) of the old 300 DPI
+FIG_DPI = int(os.environ.get('FIG_DPI', '150'))
+
+# Pie-chart palettes, sampled once at import instead of per chart
+SET3_6 = plt.cm.Set3(np.linspace(0, 1, 6))
+SET2_6 = plt.cm.Set2(np.linspace(0, 1, 6))
+
+# Antialiasing pie wedges is pure rasterization cost at dashboard DPI
+WEDGE_PROPS = {'antialiased': False}
+
+def _stat_key(path):
+    """(path, mtime_ns, size) triple identifying a file's current contents."""
+    try:
+        st = os.stat(path)
+        return (path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (path, None, None)
 
 def load_simulation_data(paths_file, node_delivered_file):
-    """Load and process simulation data"""
-    
-    # Read paths.csv
-    tx_src_count = 0
-    delivered_count = 0
-    total_events = 0
-    event_types = defaultdict(int)
-    
-    with open(paths_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            total_events += 1
-            event = row['event']
-            event_types[event] += 1
-            
-            if event == 'TX_SRC':
-                tx_src_count += 1
-            elif event == 'DELIVERED':
-                delivered_count += 1
-    
+    """Load and process simulation data.
+
+    Memoized on (path, mtime, size), so repeated report runs in the same
+    process skip the CSV parse when the files have not changed.
+    """
+    return _load_simulation_data(_stat_key(paths_file), _stat_key(node_delivered_file))
+
+@functools.lru_cache(maxsize=32)
+def _load_simulation_data(paths_key, node_key):
+    paths_file, node_delivered_file = paths_key[0], node_key[0]
+
+    # Read paths.csv in a single pass: resolve the event column index once and
+    # count with a C-implemented Counter instead of building a dict per row
+    with open(paths_file, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        event_idx = header.index('event')
+        event_types = Counter(row[event_idx] for row in reader if row)
+
+    total_events = sum(event_types.values())
+    tx_src_count = event_types.get('TX_SRC', 0)
+    delivered_count = event_types.get('DELIVERED', 0)
+
     # Count unique delivered packets
     delivered_seqs = set()
     try:
-        with open(node_delivered_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    seq = int(row['seq'])
-                    delivered_seqs.add(seq)
-                except (ValueError, KeyError):
-                    continue
-    except FileNotFoundError:
+        with open(node_delivered_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            seq_idx = header.index('seq')
+            delivered_seqs = {int(row[seq_idx]) for row in reader
+                              if row and row[seq_idx].lstrip('-').isdigit()}
+    except (FileNotFoundError, StopIteration, ValueError):
         pass
     
     unique_delivered = len(delivered_seqs) if delivered_seqs else delivered_count
@@ -52,35 +78,40 @@ def load_simulation_data(paths_file, node_delivered_file):
         'total_events': total_events,
         'overhead': total_events - tx_src_count,
         'events_per_packet': (total_events / tx_src_count) if tx_src_count > 0 else 0,
-        'event_types': dict(event_types)
+        'event_types': event_types  # Counter: dict-like, plus most_common()
     }
 
 def create_graphs():
     """Generate all comparison graphs"""
     
-    print("Loading Smart Flooding data...")
-    flooding = load_simulation_data(
-        'smart_flooding_results/paths_flooding.csv',
-        'smart_flooding_results/node_1001_flooding.csv'
-    )
-    
-    print("Loading Distance Vector data...")
-    dv = load_simulation_data(
-        'paths.csv',
-        'node_1001_delivered.csv'
-    )
+    # The two simulations are independent CSV pairs; load them concurrently
+    print("Loading Smart Flooding and Distance Vector data...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        flooding_future = executor.submit(
+            load_simulation_data,
+            'smart_flooding_results/paths_flooding.csv',
+            'smart_flooding_results/node_1001_flooding.csv'
+        )
+        dv_future = executor.submit(
+            load_simulation_data,
+            'paths.csv',
+            'node_1001_delivered.csv'
+        )
+        flooding = flooding_future.result()
+        dv = dv_future.result()
     
     # Set up the style
     plt.style.use('seaborn-v0_8-darkgrid')
+    plt.rcParams['path.simplify_threshold'] = 1.0
     colors = ['#FF6B6B', '#4ECDC4']  # Red for Flooding, Teal for DV
     
-    # Create figure with subplots
-    fig = plt.figure(figsize=(16, 12))
-    
+    # Create figure with all six subplots in one call
+    fig, ax_grid = plt.subplots(2, 3, figsize=(16, 12))
+    ax1, ax2, ax3, ax4, ax5, ax6 = ax_grid.ravel()
+
     # ====================
     # 1. Packet Delivery Ratio
     # ====================
-    ax1 = plt.subplot(2, 3, 1)
     protocols = ['Smart\nFlooding', 'Distance\nVector']
     pdrs = [flooding['pdr'], dv['pdr']]
     bars = ax1.bar(protocols, pdrs, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
@@ -89,46 +120,37 @@ def create_graphs():
     ax1.set_ylim(0, 100)
     ax1.grid(axis='y', alpha=0.3)
     
-    # Add value labels on bars
-    for bar, pdr in zip(bars, pdrs):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{pdr:.1f}%', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    # Add value labels on bars in one batched call
+    ax1.bar_label(bars, labels=[f'{pdr:.1f}%' for pdr in pdrs],
+                  padding=2, fontsize=11, fontweight='bold')
     
     # ====================
     # 2. Network Efficiency (Events per Packet)
     # ====================
-    ax2 = plt.subplot(2, 3, 2)
     events_pp = [flooding['events_per_packet'], dv['events_per_packet']]
     bars = ax2.bar(protocols, events_pp, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     ax2.set_ylabel('Events per Packet', fontsize=12, fontweight='bold')
     ax2.set_title('Network Efficiency\n(Lower is Better)', fontsize=14, fontweight='bold')
     ax2.grid(axis='y', alpha=0.3)
     
-    for bar, epp in zip(bars, events_pp):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{epp:.1f}x', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax2.bar_label(bars, labels=[f'{epp:.1f}x' for epp in events_pp],
+                  padding=2, fontsize=11, fontweight='bold')
     
     # ====================
     # 3. Total Network Overhead
     # ====================
-    ax3 = plt.subplot(2, 3, 3)
     overheads = [flooding['overhead'], dv['overhead']]
     bars = ax3.bar(protocols, overheads, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
     ax3.set_ylabel('Total Events', fontsize=12, fontweight='bold')
     ax3.set_title('Total Network Overhead\n(Lower is Better)', fontsize=14, fontweight='bold')
     ax3.grid(axis='y', alpha=0.3)
     
-    for bar, overhead in zip(bars, overheads):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{overhead:,}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax3.bar_label(bars, labels=[f'{overhead:,}' for overhead in overheads],
+                  padding=2, fontsize=11, fontweight='bold')
     
     # ====================
     # 4. Packets Sent vs Delivered
     # ====================
-    ax4 = plt.subplot(2, 3, 4)
     x = np.arange(2)
     width = 0.35
     
@@ -148,28 +170,20 @@ def create_graphs():
     ax4.grid(axis='y', alpha=0.3)
     
     # Add value labels
-    for bar in bars1:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-    for bar in bars2:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax4.bar_label(bars1, labels=[f'{int(v)}' for v in sent],
+                  padding=2, fontsize=10, fontweight='bold')
+    ax4.bar_label(bars2, labels=[f'{int(v)}' for v in delivered],
+                  padding=2, fontsize=10, fontweight='bold')
     
     # ====================
     # 5. Event Type Breakdown - Smart Flooding
     # ====================
-    ax5 = plt.subplot(2, 3, 5)
-    
-    # Get top event types for flooding
-    flood_events = sorted(flooding['event_types'].items(), key=lambda x: x[1], reverse=True)[:6]
-    labels_f = [e[0] for e in flood_events]
-    values_f = [e[1] for e in flood_events]
+    # Get top event types for flooding (bounded heap, no full sort)
+    labels_f, values_f = zip(*flooding['event_types'].most_common(6))
     
-    colors_pie = plt.cm.Set3(np.linspace(0, 1, len(labels_f)))
     wedges, texts, autotexts = ax5.pie(values_f, labels=labels_f, autopct='%1.1f%%',
-                                         startangle=90, colors=colors_pie)
+                                         startangle=90, colors=SET3_6[:len(labels_f)],
+                                         wedgeprops=WEDGE_PROPS)
     ax5.set_title('Smart Flooding\nEvent Distribution', fontsize=14, fontweight='bold')
     
     for autotext in autotexts:
@@ -180,16 +194,12 @@ def create_graphs():
     # ====================
     # 6. Event Type Breakdown - Distance Vector
     # ====================
-    ax6 = plt.subplot(2, 3, 6)
-    
     # Get top event types for DV
-    dv_events = sorted(dv['event_types'].items(), key=lambda x: x[1], reverse=True)[:6]
-    labels_d = [e[0] for e in dv_events]
-    values_d = [e[1] for e in dv_events]
+    labels_d, values_d = zip(*dv['event_types'].most_common(6))
     
-    colors_pie = plt.cm.Set2(np.linspace(0, 1, len(labels_d)))
     wedges, texts, autotexts = ax6.pie(values_d, labels=labels_d, autopct='%1.1f%%',
-                                         startangle=90, colors=colors_pie)
+                                         startangle=90, colors=SET2_6[:len(labels_d)],
+                                         wedgeprops=WEDGE_PROPS)
     ax6.set_title('Distance Vector\nEvent Distribution', fontsize=14, fontweight='bold')
     
     for autotext in autotexts:
@@ -205,15 +215,18 @@ def create_graphs():
     
     plt.tight_layout(rect=[0, 0, 1, 0.99])
     
-    # Save figure
+    # Save figure (low zlib level: much faster deflate for marginally larger files)
     output_file = 'routing_comparison_graphs.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=FIG_DPI, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
     print(f"\n✅ Graphs saved to: {output_file}")
     
     # Also create a summary metrics graph
     create_summary_graph(flooding, dv)
-    
-    plt.show()
+
+    # Only open interactive windows when there is actually a display to show them on
+    if os.environ.get('DISPLAY') and sys.stdout.isatty():
+        plt.show()
 
 def create_summary_graph(flooding, dv):
     """Create a summary comparison graph"""
@@ -238,18 +251,14 @@ def create_summary_graph(flooding, dv):
     ax.axvline(x=0, color='black', linestyle='-', linewidth=1)
     ax.grid(axis='x', alpha=0.3)
     
-    # Add value labels
-    for bar, value in zip(bars, values):
-        width = bar.get_width()
-        label_x = width + (2 if width > 0 else -2)
-        ha = 'left' if width > 0 else 'right'
-        ax.text(label_x, bar.get_y() + bar.get_height()/2.,
-                f'{value:+.1f}%', ha=ha, va='center',
-                fontsize=14, fontweight='bold')
+    # Add value labels (bar_label places them past the bar end for either sign)
+    ax.bar_label(bars, labels=[f'{value:+.1f}%' for value in values],
+                 padding=3, fontsize=14, fontweight='bold')
     
     plt.tight_layout()
     output_file = 'performance_improvement.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=FIG_DPI, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
     print(f"✅ Summary graph saved to: {output_file}")
 
 if __name__ == '__main__':
@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 """Quick preview of live simulation results"""
 
+import sys
 import pandas as pd
-import os
+from pathlib import Path
 
-os.chdir(r'e:\omnetpp-simulations\simulations\delivered_packets')
+# Resolve data files relative to this script, wherever it is run from
+here = Path(__file__).resolve().parent
+
+# Share the analyzer's CSV loader (schema, column pruning, optional Polars
+# fast path) instead of maintaining a second paths.csv parser here
+sys.path.insert(0, str(here))
+from analyze_simulation_results import read_paths_csv
 
 print("="*60)
 print("LIVE SIMULATION RESULTS - Smart Flooding")
@@ -12,10 +19,13 @@ print("="*60)
 
 # Check packets delivered to destination
 try:
-    delivered = pd.read_csv('node_1001_delivered.csv')
-    unique_packets = delivered['seq'].nunique()
-    total_deliveries = len(delivered)
-    
+    # Live CSVs can contain repeated header rows from appended runs, so
+    # coerce instead of hard-typing the column
+    delivered = pd.read_csv(here / 'node_1001_delivered.csv', usecols=['seq'])
+    seqs = pd.to_numeric(delivered['seq'], errors='coerce').dropna()
+    unique_packets = seqs.nunique()
+    total_deliveries = len(seqs)
+
     print(f"\n📦 Packets delivered to node 1001:")
     print(f"   Unique packets: {unique_packets}")
     print(f"   Total deliveries (including duplicates): {total_deliveries}")
@@ -25,24 +35,25 @@ except Exception as e:
 
 # Check forwarding activity
 try:
-    paths = pd.read_csv('paths.csv')
-    
-    # Count transmissions
-    tx_src = len(paths[paths['event'] == 'TX_SRC'])
-    tx_fwd = len(paths[paths['event'] == 'TX_FWD_DATA'])
-    
+    paths = read_paths_csv(str(here / 'paths.csv'))
+
+    # Count all event kinds in one pass instead of one scan per event
+    event_counts = paths['event'].value_counts()
+    tx_src = int(event_counts.get('TX_SRC', 0))
+    tx_fwd = int(event_counts.get('TX_FWD_DATA', 0))
+
     print(f"\n🔄 Forwarding Activity:")
     print(f"   Source transmissions: {tx_src}")
     print(f"   Relay forwards: {tx_fwd}")
     print(f"   Total hops: {len(paths)}")
     print(f"   Avg hops per packet: {tx_fwd/tx_src:.1f}x")
-    
+
     # Show latest packets
     print(f"\n📊 Latest packet sequences transmitted:")
-    latest = paths[paths['event'] == 'TX_SRC'].tail(5)
-    for _, row in latest.iterrows():
-        print(f"   Seq {int(row['packetSeq']):3d} @ t={row['simTime']:.2f}s")
-        
+    latest = paths.loc[paths['event'] == 'TX_SRC', ['packetSeq', 'simTime']].tail(5)
+    for row in latest.itertuples(index=False):
+        print(f"   Seq {int(row.packetSeq):3d} @ t={row.simTime:.2f}s")
+
 except Exception as e:
     print(f"Error reading paths: {e}")
 
@@ -10,15 +10,130 @@ Analyzes LoRa mesh DSDV simulations with mobile rescue nodes:
 """
 
 import pandas as pd
+import numpy as np
 import os
 import glob
+import io
 import math
+import mmap
 import argparse
 import csv
+import functools
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numba
+except ImportError:  # optional fast path; pure-pandas fallback below
+    numba = None
+
+# Patterns compiled once at import instead of per call (or per line).
+# The INI patterns are bytes so they can run directly over mmap'd files.
+# Example INI line: **.loRaRescueNodes[*].mobility.speed = 15mps
+_SPEED_RE = re.compile(rb'\*\*\.loRaRescueNodes\[\*\]\.mobility\.speed\s*=\s*([0-9.]+)\s*mps', re.IGNORECASE)
+# First numeric token of a param value (may carry a unit, e.g. "15s")
+_NUM_S_RE = re.compile(r'([0-9.]+)s?')
+# Timer assignment in an INI line, e.g. dsdvIncrementalPeriod = 15s
+_EQ_NUM_S_RE = re.compile(rb'=\s*([0-9.]+)s')
+# Node index inside a module path, e.g. loRaEndNodes[3] or loRaRescueNodes[0]
+_NODE_IDX_RE = re.compile(r'loRa(End|Rescue)Nodes\[(\d+)\]')
+
+# DSDV timer param: node class and timer field in one match, e.g.
+# Net.loRaNodes[0].routing.dsdvIncrementalPeriod
+_TIMER_RE = re.compile(r'loRa(EndNodes|RescueNodes|Nodes)\[.*?(dsdvIncrementalPeriod|dsdvFullUpdatePeriod)')
+_TIMER_KEYS = {
+    ('Nodes', 'dsdvIncrementalPeriod'): 'relay_incremental',
+    ('Nodes', 'dsdvFullUpdatePeriod'): 'relay_full',
+    ('EndNodes', 'dsdvIncrementalPeriod'): 'endnode_incremental',
+    ('EndNodes', 'dsdvFullUpdatePeriod'): 'endnode_full',
+    ('RescueNodes', 'dsdvIncrementalPeriod'): 'rescue_incremental',
+    ('RescueNodes', 'dsdvFullUpdatePeriod'): 'rescue_full',
+}
+
+# Report assessment buckets: the first entry whose threshold the value
+# passes supplies the message (sentinel last entries always match)
+_DELIVERY_BUCKETS = (  # delivery_rate >= threshold
+    (90, "✓ EXCELLENT: Very high delivery rate"),
+    (75, "✓ GOOD: High delivery rate"),
+    (50, "⚠ FAIR: Moderate delivery rate"),
+    (0, "❌ POOR: Low delivery rate"),
+)
+_TRANSIT_BUCKETS = (  # avg_transit < threshold
+    (2.0, "✓ FAST: Quick network response"),
+    (5.0, "✓ GOOD: Reasonable response times"),
+    (math.inf, "⚠ SLOW: High latency"),
+)
+_DSDV_UNICAST_BUCKETS = (  # unicast_pct > threshold
+    (80, "✓ EXCELLENT: High unicast ratio indicates effective DSDV routing"),
+    (50, "✓ GOOD: Moderate unicast usage with DSDV routes"),
+    (-math.inf, "⚠ WARNING: Low unicast ratio may indicate routing issues"),
+)
+_SMART_FLOODING_UNICAST_BUCKETS = (  # unicast_pct < threshold
+    (20, "✓ EXPECTED: Low unicast ratio indicates broadcast-based flooding"),
+    (50, "✓ GOOD: Smart flooding with some unicast optimization"),
+    (math.inf, "⚠ NOTE: High unicast ratio unusual for flooding protocol"),
+)
+
+# Bitmap width for per-packet visited-node tracking; covers relay, end
+# (1000+) and rescue (2000+) node IDs with headroom
+_NODE_BITMAP_SIZE = 3000
+
+# Integer event codes shared by the hop kernel and the per-event dispatch
+# in analyze_dsdv_packet_paths (-1 after map/fillna means "other event")
+_EVENT_CODES = {'TX_SRC': 0, 'TX_FWD_DATA': 1, 'TX_FWD_ACK': 2, 'DELIVERED': 3}
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _packet_hop_kernel(event_codes, ttls, offsets):
+        """
+        TTL-based hop counts per packet over CSR-packed event groups.
+        event_codes: 0=TX_SRC, 3=DELIVERED (others ignored); ttls carry -1
+        for missing values. Returns (first_hops, last_hops, hops_buf,
+        hop_offsets) with -1 meaning "no valid TTL delivery" and hops_buf
+        holding every delivery's hop count, CSR-indexed by hop_offsets.
+        """
+        n = offsets.shape[0] - 1
+        first_hops = np.full(n, -1, np.int64)
+        last_hops = np.full(n, -1, np.int64)
+        counts = np.zeros(n + 1, np.int64)
+
+        # Pass 1: count valid TTL deliveries per packet
+        for g in numba.prange(n):
+            initial_ttl = -1
+            for i in range(offsets[g], offsets[g + 1]):
+                code = event_codes[i]
+                if code == 0:
+                    if initial_ttl < 0:
+                        initial_ttl = ttls[i]
+                elif code == 3 and initial_ttl >= 0 and ttls[i] >= 0:
+                    if initial_ttl - ttls[i] >= 0:
+                        counts[g + 1] += 1
+
+        hop_offsets = np.cumsum(counts)
+        hops_buf = np.empty(hop_offsets[-1], np.int64)
+
+        # Pass 2: record each delivery's hop count plus first/last per packet
+        for g in numba.prange(n):
+            initial_ttl = -1
+            pos = hop_offsets[g]
+            for i in range(offsets[g], offsets[g + 1]):
+                code = event_codes[i]
+                if code == 0:
+                    if initial_ttl < 0:
+                        initial_ttl = ttls[i]
+                elif code == 3 and initial_ttl >= 0 and ttls[i] >= 0:
+                    hops = initial_ttl - ttls[i]
+                    if hops >= 0:
+                        hops_buf[pos] = hops
+                        pos += 1
+                        if first_hops[g] < 0:
+                            first_hops[g] = hops
+                        last_hops[g] = hops
+
+        return first_hops, last_hops, hops_buf, hop_offsets
+
 def find_latest_results_directory(base_dir="./"):
     """Find the most recent results directory containing .sca files."""
     possible_dirs = [
@@ -34,9 +149,10 @@ def find_latest_results_directory(base_dir="./"):
     valid_dirs = []
     for results_dir in possible_dirs:
         if os.path.isdir(results_dir):
-            sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
+            sca_files = _sca_files(results_dir)
             if sca_files:
-                latest_time = max(os.path.getmtime(f) for f in sca_files)
+                # Listing is newest-first, so the head carries the max mtime
+                latest_time = os.path.getmtime(sca_files[0])
                 valid_dirs.append((results_dir, latest_time, len(sca_files)))
     
     if not valid_dirs:
@@ -46,6 +162,141 @@ def find_latest_results_directory(base_dir="./"):
     print(f"Using results directory: {latest_dir[0]} ({latest_dir[2]} .sca files)")
     return latest_dir[0]
 
+@functools.lru_cache(maxsize=16)
+def _sca_files(results_dir):
+    """
+    List .sca files in results_dir, newest first (cached per run).
+    os.scandir supplies the mtimes alongside the directory entries, so the
+    listing costs one stat per file instead of a stat per sort comparison.
+    """
+    entries = []
+    try:
+        with os.scandir(results_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.sca') and entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return ()
+    entries.sort(reverse=True)
+    return tuple(path for _, path in entries)
+
+def _latest_sca(results_dir):
+    """Most recent .sca file in results_dir, or None if there are none."""
+    sca_files = _sca_files(results_dir)
+    return sca_files[0] if sca_files else None
+
+@functools.lru_cache(maxsize=8)
+def _parse_sca_file(sca_file):
+    """
+    Parse a .sca file once into (scalars, params) tuple lists.
+    scalars: (module_path, scalar_name, value_str) per scalar line.
+    params: (param_path, value_str) per param line, with the full value
+    remainder so unit suffixes like "15s" survive.
+    The speed, coordinate, energy, protocol and timer extractors all share
+    this cache instead of re-reading the same file line-by-line.
+    """
+    scalars = []
+    params = []
+    # Binary mode with a large buffer: prefix checks and splits run on bytes
+    # (fast C paths) and only the fields actually kept get decoded
+    with open(sca_file, 'rb', buffering=1 << 20) as f:
+        for line in f:
+            if line.startswith(b'scalar '):
+                parts = line.split()
+                if len(parts) >= 4:
+                    scalars.append((parts[1].decode('ascii'),
+                                    parts[2].decode('ascii'),
+                                    parts[3].decode('ascii')))
+            elif line.startswith(b'param '):
+                parts = line.strip().split(None, 2)
+                if len(parts) >= 3:
+                    params.append((parts[1].decode('ascii'),
+                                   parts[2].decode('ascii')))
+    return scalars, params
+
+def _ini_files(config_file=None):
+    """INI files to scan: the explicit config if given, else *.ini next to this script."""
+    if config_file and os.path.exists(config_file):
+        return (config_file,)
+    simulations_dir = os.path.dirname(os.path.abspath(__file__))
+    return tuple(glob.glob(os.path.join(simulations_dir, "*.ini")))
+
+@functools.lru_cache(maxsize=4)
+def _scan_ini(ini_files):
+    """
+    One fused pass over the INI files collecting every fallback the
+    extractors need: rescue node speed, whether a DSDV routingProtocol is
+    configured, and the six DSDV timer values. Replaces three separate
+    full reads of the same files.
+    """
+    speed = None
+    speed_source = "unknown"
+    is_dsdv = False
+    timers = {
+        'relay_incremental': None,
+        'relay_full': None,
+        'endnode_incremental': None,
+        'endnode_full': None,
+        'rescue_incremental': None,
+        'rescue_full': None
+    }
+
+    for ini_file in ini_files:
+        try:
+            with open(ini_file, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:  # zero-length file cannot be mapped
+                    continue
+                with mm:
+                    if speed is None:
+                        match = _SPEED_RE.search(mm)
+                        if match:
+                            speed = float(match.group(1))
+                            speed_source = f"ini:{os.path.basename(ini_file)}"
+
+                    # OS-level byte search over the mapped file; no
+                    # full-file decode or Python-string allocation
+                    if (not is_dsdv and mm.find(b'routingProtocol') != -1
+                            and mm.find(b'"dsdv"') != -1):
+                        is_dsdv = True
+
+                    # Only walk the lines when a timer keyword exists at all
+                    if (mm.find(b'dsdvIncrementalPeriod') == -1
+                            and mm.find(b'dsdvFullUpdatePeriod') == -1):
+                        continue
+
+                    mm.seek(0)
+                    for line in iter(mm.readline, b''):
+                        if b'dsdvIncrementalPeriod' not in line and b'dsdvFullUpdatePeriod' not in line:
+                            continue
+                        value_match = _EQ_NUM_S_RE.search(line)
+                        if not value_match:
+                            continue
+                        value = float(value_match.group(1))
+
+                        if b'loRaNodes[*]' in line and timers['relay_incremental'] is None:
+                            if b'dsdvIncrementalPeriod' in line:
+                                timers['relay_incremental'] = value
+                            elif b'dsdvFullUpdatePeriod' in line:
+                                timers['relay_full'] = value
+
+                        elif b'loRaEndNodes[*]' in line and timers['endnode_incremental'] is None:
+                            if b'dsdvIncrementalPeriod' in line:
+                                timers['endnode_incremental'] = value
+                            elif b'dsdvFullUpdatePeriod' in line:
+                                timers['endnode_full'] = value
+
+                        elif b'loRaRescueNodes[*]' in line and timers['rescue_incremental'] is None:
+                            if b'dsdvIncrementalPeriod' in line:
+                                timers['rescue_incremental'] = value
+                            elif b'dsdvFullUpdatePeriod' in line:
+                                timers['rescue_full'] = value
+        except Exception:
+            continue
+
+    return {'speed': speed, 'speed_source': speed_source, 'is_dsdv': is_dsdv, 'timers': timers}
+
 def extract_rescue_node_speed(results_dir=None, config_file=None):
     """
     Extract rescue node speed from INI configuration or .sca files.
@@ -56,72 +307,39 @@ def extract_rescue_node_speed(results_dir=None, config_file=None):
     
     # Try to find speed in .sca file first (check both param and scalar lines)
     if results_dir and os.path.isdir(results_dir):
-        sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
-        sca_files.sort(key=os.path.getmtime, reverse=True)
-        
-        for sca_file in sca_files[:1]:  # Check only most recent
+        sca_file = _latest_sca(results_dir)  # Check only most recent
+        if sca_file:
             try:
-                with open(sca_file, 'r') as f:
-                    for line in f:
-                        # Check both 'param' and 'scalar' lines
-                        if line.startswith('param '):
-                            # param *.loRaRescueNodes[0].mobility.speed 8mps
-                            if 'loRaRescueNodes' in line and 'mobility.speed' in line:
-                                parts = line.strip().split()
-                                if len(parts) >= 3:
-                                    # Extract numeric value (may have units like "8mps")
-                                    value_str = parts[2]
-                                    try:
-                                        # Remove 'mps' suffix if present
-                                        speed = float(value_str.replace('mps', ''))
-                                        speed_source = f"sca:{os.path.basename(sca_file)}"
-                                        return speed, speed_source
-                                    except ValueError:
-                                        pass
-                        
-                        elif line.startswith('scalar '):
-                            parts = line.strip().split()
-                            if len(parts) < 4:
-                                continue
-                            module_path = parts[1]
-                            scalar_name = parts[2]
-                            value_str = parts[3]
-                            
-                            # Look for rescue node speed scalar
-                            if 'loRaRescueNodes' in module_path and scalar_name in ('speed', 'mobilitySpeed'):
-                                try:
-                                    speed = float(value_str)
-                                    speed_source = f"sca:{os.path.basename(sca_file)}"
-                                    return speed, speed_source
-                                except ValueError:
-                                    pass
-            except Exception as e:
-                continue
-    
-    # Try to extract from INI configuration files
-    if config_file and os.path.exists(config_file):
-        ini_files = [config_file]
-    else:
-        # Search for INI files in simulations directory
-        simulations_dir = os.path.dirname(os.path.abspath(__file__))
-        ini_files = glob.glob(os.path.join(simulations_dir, "*.ini"))
-    
-    # Pattern to match rescue node speed configuration
-    # Examples: **.loRaRescueNodes[*].mobility.speed = 15mps
-    speed_pattern = re.compile(r'\*\*\.loRaRescueNodes\[\*\]\.mobility\.speed\s*=\s*([0-9.]+)\s*mps', re.IGNORECASE)
-    
-    for ini_file in ini_files:
-        try:
-            with open(ini_file, 'r') as f:
-                for line in f:
-                    match = speed_pattern.search(line)
-                    if match:
-                        speed = float(match.group(1))
-                        speed_source = f"ini:{os.path.basename(ini_file)}"
+                scalars, params = _parse_sca_file(sca_file)
+            except Exception:
+                scalars, params = [], []
+
+            # param *.loRaRescueNodes[0].mobility.speed 8mps
+            for param_path, value_str in params:
+                if 'loRaRescueNodes' in param_path and 'mobility.speed' in param_path:
+                    try:
+                        # Extract numeric value (may have units like "8mps")
+                        speed = float(value_str.split()[0].replace('mps', ''))
+                        speed_source = f"sca:{os.path.basename(sca_file)}"
                         return speed, speed_source
-        except Exception:
-            continue
+                    except ValueError:
+                        pass
+
+            # Look for rescue node speed scalar
+            for module_path, scalar_name, value_str in scalars:
+                if 'loRaRescueNodes' in module_path and scalar_name in ('speed', 'mobilitySpeed'):
+                    try:
+                        speed = float(value_str)
+                        speed_source = f"sca:{os.path.basename(sca_file)}"
+                        return speed, speed_source
+                    except ValueError:
+                        pass
     
+    # Fall back to the fused INI scan
+    ini_info = _scan_ini(_ini_files(config_file))
+    if ini_info['speed'] is not None:
+        return ini_info['speed'], ini_info['speed_source']
+
     return speed, speed_source
 
 def extract_node_coordinates(results_dir, node_ids=[1000, 2000]):
@@ -142,85 +360,68 @@ def extract_node_coordinates(results_dir, node_ids=[1000, 2000]):
     if not results_dir or not os.path.isdir(results_dir):
         return coordinates, extraction_info
     
-    sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
-    sca_files.sort(key=os.path.getmtime, reverse=True)
-    
-    for sca_file in sca_files:
+    # Coordinates still missing across node_ids (x and y each count once);
+    # lets the scan stop without an all()-style check per scalar
+    remaining = 2 * len(node_ids)
+
+    for sca_file in _sca_files(results_dir):
         extraction_info['files_scanned'] += 1
         found_coords = False
-        
+
         try:
-            with open(sca_file, 'r') as f:
-                for line in f:
-                    if not line.startswith('scalar '):
-                        continue
-                    
-                    parts = line.strip().split()
-                    if len(parts) < 4:
-                        continue
-                    
-                    module_path = parts[1]
-                    scalar_name = parts[2]
-                    value_str = parts[3]
-                    
-                    extraction_info['scalars_found'] += 1
-                    
-                    if scalar_name not in ('CordiX', 'CordiY', 'positionX', 'positionY'):
-                        continue
-                    
-                    # Extract node ID
-                    node_id = None
-                    
-                    # End nodes: loRaEndNodes[0] -> 1000
-                    if 'loRaEndNodes[' in module_path:
-                        start = module_path.find('loRaEndNodes[') + len('loRaEndNodes[')
-                        end = module_path.find(']', start)
-                        if end != -1:
-                            try:
-                                idx = int(module_path[start:end])
-                                node_id = 1000 + idx
-                            except ValueError:
-                                continue
-                    
-                    # Rescue nodes: loRaRescueNodes[0] -> 2000
-                    elif 'loRaRescueNodes[' in module_path:
-                        start = module_path.find('loRaRescueNodes[') + len('loRaRescueNodes[')
-                        end = module_path.find(']', start)
-                        if end != -1:
-                            try:
-                                idx = int(module_path[start:end])
-                                node_id = 2000 + idx
-                            except ValueError:
-                                continue
-                    
-                    if node_id not in node_ids:
-                        continue
-                    
-                    try:
-                        coord_val = float(value_str)
-                    except ValueError:
-                        continue
-                    
-                    if node_id not in coordinates:
-                        coordinates[node_id] = {'x': None, 'y': None}
-                    
-                    if scalar_name in ('CordiX', 'positionX'):
-                        coordinates[node_id]['x'] = coord_val
-                        coordinates[node_id]['source_file'] = os.path.basename(sca_file)
-                        extraction_info['coordinates_extracted'] += 1
-                        found_coords = True
-                        if not extraction_info['source_file']:
-                            extraction_info['source_file'] = os.path.basename(sca_file)
-                    elif scalar_name in ('CordiY', 'positionY'):
-                        coordinates[node_id]['y'] = coord_val
-                        coordinates[node_id]['source_file'] = os.path.basename(sca_file)
-                        extraction_info['coordinates_extracted'] += 1
-                        found_coords = True
-                        if not extraction_info['source_file']:
-                            extraction_info['source_file'] = os.path.basename(sca_file)
+            scalars, _ = _parse_sca_file(sca_file)
         except Exception as e:
             print(f"Warning: Error reading {sca_file}: {e}")
             continue
+
+        for module_path, scalar_name, value_str in scalars:
+            extraction_info['scalars_found'] += 1
+
+            if scalar_name not in ('CordiX', 'CordiY', 'positionX', 'positionY'):
+                continue
+
+            # Extract node ID in a single pass:
+            # loRaEndNodes[0] -> 1000, loRaRescueNodes[0] -> 2000
+            m = _NODE_IDX_RE.search(module_path)
+            if not m:
+                continue
+            base = 1000 if m.group(1) == 'End' else 2000
+            node_id = base + int(m.group(2))
+
+            if node_id not in node_ids:
+                continue
+
+            try:
+                coord_val = float(value_str)
+            except ValueError:
+                continue
+
+            if node_id not in coordinates:
+                coordinates[node_id] = {'x': None, 'y': None}
+
+            if scalar_name in ('CordiX', 'positionX'):
+                if coordinates[node_id]['x'] is None:
+                    remaining -= 1
+                coordinates[node_id]['x'] = coord_val
+                coordinates[node_id]['source_file'] = os.path.basename(sca_file)
+                extraction_info['coordinates_extracted'] += 1
+                found_coords = True
+                if not extraction_info['source_file']:
+                    extraction_info['source_file'] = os.path.basename(sca_file)
+            elif scalar_name in ('CordiY', 'positionY'):
+                if coordinates[node_id]['y'] is None:
+                    remaining -= 1
+                coordinates[node_id]['y'] = coord_val
+                coordinates[node_id]['source_file'] = os.path.basename(sca_file)
+                extraction_info['coordinates_extracted'] += 1
+                found_coords = True
+                if not extraction_info['source_file']:
+                    extraction_info['source_file'] = os.path.basename(sca_file)
+
+            # Every requested coordinate is populated: stop scanning
+            # immediately instead of walking the rest of the scalars
+            if remaining == 0:
+                break
         
         # Stop after finding coordinates in the first file
         if found_coords and all(nid in coordinates for nid in node_ids):
@@ -235,14 +436,22 @@ def extract_node_coordinates(results_dir, node_ids=[1000, 2000]):
     
     return complete_coords, extraction_info
 
+def pairwise_distances(coords_dict, ids_a, ids_b):
+    """
+    Euclidean distances between two sets of node IDs as an (len(a), len(b))
+    array. Coordinates are stacked into float64 arrays once so the distance
+    math runs vectorized in NumPy instead of per pair in Python.
+    """
+    a = np.array([[coords_dict[i]['x'], coords_dict[i]['y']] for i in ids_a], dtype=np.float64)
+    b = np.array([[coords_dict[i]['x'], coords_dict[i]['y']] for i in ids_b], dtype=np.float64)
+    return np.sqrt(((a[:, None] - b[None, :]) ** 2).sum(-1))
+
 def calculate_distance(coord1, coord2):
     """Calculate Euclidean distance between two coordinate dictionaries."""
     if not coord1 or not coord2:
         return None
-    
-    dx = coord1['x'] - coord2['x']
-    dy = coord1['y'] - coord2['y']
-    return math.sqrt(dx*dx + dy*dy)
+
+    return float(pairwise_distances({0: coord1, 1: coord2}, [0], [1])[0, 0])
 
 def extract_total_energy(results_dir):
     """
@@ -256,40 +465,41 @@ def extract_total_energy(results_dir):
     if not results_dir or not os.path.isdir(results_dir):
         return None, energy_readings
     
-    sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
-    sca_files.sort(key=os.path.getmtime, reverse=True)
-    
-    for sca_file in sca_files[:1]:  # Check most recent file
+    sca_file = _latest_sca(results_dir)  # Check most recent file
+    if sca_file:
         try:
-            with open(sca_file, 'r') as f:
-                for line in f:
-                    if not line.startswith('scalar '):
-                        continue
-                    
-                    parts = line.strip().split()
-                    if len(parts) < 4:
-                        continue
-                    
-                    module_path = parts[1]
-                    scalar_name = parts[2]
-                    value_str = parts[3]
-                    
-                    # Look for energy scalars
-                    if scalar_name in ('totalEnergyConsumed', 'residualEnergyCapacity', 'energyConsumed'):
-                        try:
-                            energy_val = float(value_str)
-                            energy_readings.append({
-                                'module': module_path,
-                                'metric': scalar_name,
-                                'value': energy_val
-                            })
-                            total_energy += abs(energy_val)  # Use absolute value
-                            energy_source = os.path.basename(sca_file)
-                        except ValueError:
-                            pass
+            scalars, _ = _parse_sca_file(sca_file)
         except Exception as e:
             print(f"Warning: Error reading energy from {sca_file}: {e}")
-            continue
+            scalars = []
+
+        # Select the energy rows in one comprehension, then convert and
+        # reduce with NumPy instead of a per-line Python accumulator
+        selected = [row for row in scalars
+                    if row[1] in ('totalEnergyConsumed', 'residualEnergyCapacity', 'energyConsumed')]
+        if selected:
+            try:
+                vals = np.array([row[2] for row in selected], dtype=np.float64)
+            except ValueError:
+                # Malformed value on some line: redo the conversion row by
+                # row, dropping only the lines that fail to parse
+                kept, parsed = [], []
+                for row in selected:
+                    try:
+                        parsed.append(float(row[2]))
+                        kept.append(row)
+                    except ValueError:
+                        pass
+                selected = kept
+                vals = np.array(parsed, dtype=np.float64)
+
+            total_energy = float(np.abs(vals).sum())  # Use absolute values
+            energy_readings = [
+                {'module': module_path, 'metric': scalar_name, 'value': float(val)}
+                for (module_path, scalar_name, _), val in zip(selected, vals)
+            ]
+            if energy_readings:
+                energy_source = os.path.basename(sca_file)
     
     if total_energy > 0:
         return total_energy, energy_readings
@@ -304,49 +514,38 @@ def detect_routing_protocol(results_dir, config_file=None):
     
     # Try .sca file first
     if results_dir and os.path.isdir(results_dir):
-        sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
-        sca_files.sort(key=os.path.getmtime, reverse=True)
-        
-        for sca_file in sca_files[:1]:
+        sca_file = _latest_sca(results_dir)
+        if sca_file:
             try:
-                with open(sca_file, 'r') as f:
-                    for line in f:
-                        # Check for routing protocol parameter
-                        if 'param' in line and 'routingProtocol' in line:
-                            if 'dsdv' in line.lower():
-                                return 'dsdv'
-                        
-                        # Check for routing metric (indicates flooding vs DSDV)
-                        if 'param' in line and 'routingMetric' in line:
-                            if 'loRaNodes[' in line or '**.loRaNodes[*]' in line:
-                                # Extract metric value
-                                if '"2"' in line or ' 2' in line:
-                                    protocol = 'smart_flooding'
-                                elif '"1"' in line or ' 1' in line:
-                                    protocol = 'flooding'
-                                elif '"3"' in line or ' 3' in line:
-                                    # Could be hop-count routing, check if DSDV
-                                    pass
+                _, params = _parse_sca_file(sca_file)
             except Exception:
-                continue
-    
-    # Fallback to INI file
-    if protocol == 'unknown':
-        if config_file and os.path.exists(config_file):
-            ini_files = [config_file]
-        else:
-            simulations_dir = os.path.dirname(os.path.abspath(__file__))
-            ini_files = glob.glob(os.path.join(simulations_dir, "*.ini"))
-        
-        for ini_file in ini_files:
-            try:
-                with open(ini_file, 'r') as f:
-                    content = f.read()
-                    if 'routingProtocol' in content and '"dsdv"' in content:
+                params = []
+
+            for param_path, param_value in params:
+                line = param_path + ' ' + param_value
+
+                # Check for routing protocol parameter
+                if 'routingProtocol' in line:
+                    if 'dsdv' in line.lower():
                         return 'dsdv'
-            except Exception:
-                continue
+
+                # Check for routing metric (indicates flooding vs DSDV)
+                if 'routingMetric' in line:
+                    if 'loRaNodes[' in line or '**.loRaNodes[*]' in line:
+                        # Extract metric value
+                        if '"2"' in line or ' 2' in line:
+                            protocol = 'smart_flooding'
+                        elif '"1"' in line or ' 1' in line:
+                            protocol = 'flooding'
+                        elif '"3"' in line or ' 3' in line:
+                            # Could be hop-count routing, check if DSDV
+                            pass
     
+    # Fallback to the fused INI scan
+    if protocol == 'unknown':
+        if _scan_ini(_ini_files(config_file))['is_dsdv']:
+            return 'dsdv'
+
     return protocol if protocol != 'unknown' else 'dsdv'  # Default to DSDV
 
 def extract_dsdv_timers(results_dir, config_file=None):
@@ -365,93 +564,74 @@ def extract_dsdv_timers(results_dir, config_file=None):
     
     # Try .sca file first (has actual parameter values)
     if results_dir and os.path.isdir(results_dir):
-        sca_files = glob.glob(os.path.join(results_dir, "*.sca"))
-        sca_files.sort(key=os.path.getmtime, reverse=True)
-        
-        for sca_file in sca_files[:1]:
-            try:
-                with open(sca_file, 'r') as f:
-                    for line in f:
-                        if not line.startswith('param '):
-                            continue
-                        
-                        parts = line.strip().split()
-                        if len(parts) < 3:
-                            continue
-                        
-                        param_path = parts[1]
-                        param_value = ' '.join(parts[2:])
-                        
-                        # Extract numeric value from param_value (may have units like "15s")
-                        value_match = re.search(r'([0-9.]+)s?', param_value)
-                        if not value_match:
-                            continue
-                        
-                        value = float(value_match.group(1))
-                        
-                        # Relay nodes (loRaNodes)
-                        if 'loRaNodes[' in param_path or '**.loRaNodes[*]' in param_path:
-                            if 'dsdvIncrementalPeriod' in param_path:
-                                timers['relay_incremental'] = value
-                            elif 'dsdvFullUpdatePeriod' in param_path:
-                                timers['relay_full'] = value
-                        
-                        # End nodes
-                        elif 'loRaEndNodes[' in param_path or '**.loRaEndNodes[*]' in param_path:
-                            if 'dsdvIncrementalPeriod' in param_path:
-                                timers['endnode_incremental'] = value
-                            elif 'dsdvFullUpdatePeriod' in param_path:
-                                timers['endnode_full'] = value
-                        
-                        # Rescue nodes
-                        elif 'loRaRescueNodes[' in param_path or '**.loRaRescueNodes[*]' in param_path:
-                            if 'dsdvIncrementalPeriod' in param_path:
-                                timers['rescue_incremental'] = value
-                            elif 'dsdvFullUpdatePeriod' in param_path:
-                                timers['rescue_full'] = value
-            except Exception as e:
-                continue
-    
-    # Fallback to INI file if needed
-    if any(v is None for v in timers.values()):
-        if config_file and os.path.exists(config_file):
-            ini_files = [config_file]
-        else:
-            simulations_dir = os.path.dirname(os.path.abspath(__file__))
-            ini_files = glob.glob(os.path.join(simulations_dir, "*.ini"))
-        
-        for ini_file in ini_files:
+        sca_file = _latest_sca(results_dir)
+        if sca_file:
             try:
-                with open(ini_file, 'r') as f:
-                    for line in f:
-                        if 'dsdvIncrementalPeriod' in line or 'dsdvFullUpdatePeriod' in line:
-                            value_match = re.search(r'=\s*([0-9.]+)s', line)
-                            if not value_match:
-                                continue
-                            value = float(value_match.group(1))
-                            
-                            if 'loRaNodes[*]' in line and timers['relay_incremental'] is None:
-                                if 'dsdvIncrementalPeriod' in line:
-                                    timers['relay_incremental'] = value
-                                elif 'dsdvFullUpdatePeriod' in line:
-                                    timers['relay_full'] = value
-                            
-                            elif 'loRaEndNodes[*]' in line and timers['endnode_incremental'] is None:
-                                if 'dsdvIncrementalPeriod' in line:
-                                    timers['endnode_incremental'] = value
-                                elif 'dsdvFullUpdatePeriod' in line:
-                                    timers['endnode_full'] = value
-                            
-                            elif 'loRaRescueNodes[*]' in line and timers['rescue_incremental'] is None:
-                                if 'dsdvIncrementalPeriod' in line:
-                                    timers['rescue_incremental'] = value
-                                elif 'dsdvFullUpdatePeriod' in line:
-                                    timers['rescue_full'] = value
+                _, params = _parse_sca_file(sca_file)
             except Exception:
-                continue
+                params = []
+
+            for param_path, param_value in params:
+                # One regex picks out node class and timer field together,
+                # replacing six per-line substring checks
+                m = _TIMER_RE.search(param_path)
+                if not m:
+                    continue
+
+                # Extract numeric value from param_value (may have units like
+                # "15s"); plain float conversion first, regex only on failure
+                try:
+                    value = float(param_value.rstrip('s'))
+                except ValueError:
+                    value_match = _NUM_S_RE.search(param_value)
+                    if not value_match:
+                        continue
+                    value = float(value_match.group(1))
+
+                timers[_TIMER_KEYS[m.group(1), m.group(2)]] = value
     
+    # Fallback to the fused INI scan if needed; a group is only taken from
+    # the INI when the .sca left its incremental period unset, matching the
+    # old per-line gate
+    if any(v is None for v in timers.values()):
+        ini_timers = _scan_ini(_ini_files(config_file))['timers']
+        for group in ('relay', 'endnode', 'rescue'):
+            if timers[f'{group}_incremental'] is None:
+                for field in ('incremental', 'full'):
+                    key = f'{group}_{field}'
+                    if timers[key] is None and ini_timers[key] is not None:
+                        timers[key] = ini_timers[key]
+
     return timers
 
+# Stable columns of paths.csv, pinned so the parser skips dtype inference
+# for them; event as category avoids one Python string object per row.
+# Columns that may carry gaps (chosenVia, ttlAfterDecr, ...) stay inferred.
+_PATHS_DTYPES = {'simTime': 'float64', 'event': 'category', 'packetSeq': 'int64'}
+
+def load_paths_csv(paths_csv):
+    """
+    Load paths.csv, preferring pandas' multithreaded pyarrow engine.
+    Falls back to the default C engine when pyarrow is not installed or
+    rejects the file, and to full dtype inference as a last resort.
+    """
+    try:
+        return pd.read_csv(paths_csv, engine='pyarrow', dtype=_PATHS_DTYPES)
+    except (ImportError, ValueError):
+        pass
+    try:
+        return pd.read_csv(paths_csv, dtype=_PATHS_DTYPES)
+    except ValueError:
+        return pd.read_csv(paths_csv)
+
+class PacketPaths(dict):
+    """
+    Mapping of packet_seq -> path_info dict, plus columnar per-packet
+    aggregate arrays in .stats (structure-of-arrays) so downstream totals
+    and transit statistics reduce in NumPy instead of walking the dicts.
+    """
+    stats = None
+
 def analyze_dsdv_packet_paths(df):
     """
     Analyze DSDV packet paths with focus on:
@@ -461,112 +641,231 @@ def analyze_dsdv_packet_paths(df):
     - Duplicate deliveries (copies received at destination)
     - Unique nodes that processed packets
     """
-    packet_paths = {}
-    
-    for packet_seq in df['packetSeq'].unique():
-        packet_events = df[df['packetSeq'] == packet_seq].sort_values('simTime')
-        
+    packet_paths = PacketPaths()
+
+    # Categorical packetSeq lets every groupby below dispatch through integer
+    # codes instead of repeated equality scans over the column
+    df = df.assign(packetSeq=df['packetSeq'].astype('category'))
+
+    # Sort once and split with a single groupby instead of re-scanning the
+    # whole frame (and re-sorting) for every packet sequence number
+    df_sorted = df.sort_values(['packetSeq', 'simTime'], kind='mergesort')
+    has_via = 'chosenVia' in df_sorted.columns
+    has_hop_type = 'nextHopType' in df_sorted.columns
+    has_node = 'currentNode' in df_sorted.columns
+    has_ttl = 'ttlAfterDecr' in df_sorted.columns
+
+    events = df_sorted['event']
+    is_tx = events.eq('TX_SRC')
+    is_del = events.eq('DELIVERED')
+
+    # Vectorized per-packet aggregates; only the ordered path structures
+    # (path_events, path_nodes) still need the per-event loop below
+
+    # First TX_SRC per packet: source, destination, generation time, TTL
+    tx_first = df_sorted.loc[is_tx].groupby('packetSeq', sort=False, observed=True).first()
+    tx_src = tx_first['src'].to_dict()
+    tx_dst = tx_first['dst'].to_dict()
+    tx_time = tx_first['simTime'].to_dict()
+    tx_ttl = {}
+    if has_ttl:
+        for seq, ttl in tx_first['ttlAfterDecr'].items():
+            try:
+                tx_ttl[seq] = int(ttl) if not pd.isna(ttl) else None
+            except Exception:
+                tx_ttl[seq] = None
+
+    # Deliveries: first arrival time and copy count per packet
+    del_agg = df_sorted.loc[is_del].groupby('packetSeq', sort=False, observed=True)['simTime'].agg(['min', 'count'])
+    del_first_time = del_agg['min'].to_dict()
+    del_copies = del_agg['count'].to_dict()
+
+    # Unicast vs broadcast forwards (chosenVia == 16777215 is BROADCAST_ADDRESS)
+    uc_counts = {}
+    bc_counts = {}
+    if has_via:
+        fwd_rows = df_sorted.loc[events.isin(['TX_FWD_DATA', 'TX_FWD_ACK'])]
+        if len(fwd_rows):
+            via = fwd_rows['chosenVia']
+            flags = pd.DataFrame({
+                'bc': via.eq(16777215),
+                'uc': via.notna() & via.ne(16777215)
+            })
+            fwd_agg = flags.groupby(fwd_rows['packetSeq'], sort=False, observed=True).sum()
+            bc_counts = fwd_agg['bc'].to_dict()
+            uc_counts = fwd_agg['uc'].to_dict()
+
+    # Typed, sentinel-filled column arrays for the per-event loop below:
+    # missing values become -1 up front, so the loop runs on plain integer
+    # compares instead of pd.isna()/int() per row. Groups are contiguous
+    # after the sort, so CSR offsets slice each packet out of these arrays.
+    seq_codes = df_sorted['packetSeq'].cat.codes.to_numpy()
+    if len(seq_codes):
+        starts = np.flatnonzero(np.diff(seq_codes)) + 1
+        offsets = np.concatenate(([0], starts, [len(seq_codes)])).astype(np.int64)
+    else:
+        # Empty frame: no groups, so the per-packet loop must not run
+        offsets = np.zeros(1, dtype=np.int64)
+    seq_labels = df_sorted['packetSeq'].cat.categories
+
+    sim_times_all = df_sorted['simTime'].to_numpy()
+    events_all = df_sorted['event'].to_numpy()
+    # Missing optional columns degrade to all-sentinel arrays, so the loop
+    # and hop kernel simply skip node tracking / TTL hop counts for them
+    if has_node:
+        nodes_all = pd.to_numeric(df_sorted['currentNode'], errors='coerce').fillna(-1).astype(np.int32).to_numpy()
+    else:
+        nodes_all = np.full(len(df_sorted), -1, dtype=np.int32)
+    if has_ttl:
+        ttls_all = pd.to_numeric(df_sorted['ttlAfterDecr'], errors='coerce').fillna(-1).astype(np.int32).to_numpy()
+    else:
+        ttls_all = np.full(len(df_sorted), -1, dtype=np.int32)
+    vias_all = df_sorted['chosenVia'].to_numpy() if has_via else None
+    hop_types_all = df_sorted['nextHopType'].to_numpy() if has_hop_type else None
+
+    # int8 event codes drive both the numba kernel and the loop dispatch
+    # below: integer compares instead of repeated string equality per row
+    event_codes_all = df_sorted['event'].map(_EVENT_CODES).fillna(-1).astype(np.int8).to_numpy()
+
+    # Optional numba fast path for the ordered TTL hop-count state machine;
+    # CSR group g lines up with the g-th slice in the loop below
+    use_hop_kernel = numba is not None
+    if use_hop_kernel:
+        first_hops, last_hops, hops_buf, hop_offsets = _packet_hop_kernel(event_codes_all, ttls_all, offsets)
+
+    for g in range(len(offsets) - 1):
+        lo = int(offsets[g])
+        hi = int(offsets[g + 1])
+        packet_seq = seq_labels[seq_codes[lo]]
+        initial_ttl = tx_ttl.get(packet_seq)
+        generated_time = tx_time.get(packet_seq)
+        delivered_time = del_first_time.get(packet_seq)
+
         path_info = {
             'packet_seq': packet_seq,
-            'source': None,
-            'destination': None,
-            'generated_time': None,
-            'delivered_time': None,
+            'source': tx_src.get(packet_seq),
+            'destination': tx_dst.get(packet_seq),
+            'generated_time': generated_time,
+            'delivered_time': delivered_time,
             'path_nodes': [],
             'hop_count': 0,
             'transit_time': None,
-            'delivered': False,
+            'delivered': packet_seq in del_copies,
             'path_events': [],
-            'unicast_forwards': 0,
-            'broadcast_forwards': 0,
-            'initial_ttl': None,
+            'unicast_forwards': int(uc_counts.get(packet_seq, 0)),
+            'broadcast_forwards': int(bc_counts.get(packet_seq, 0)),
+            'initial_ttl': initial_ttl,
             'deliver_hop_counts': [],
             'first_transit_time': None,
             'first_hop_count': None,
-            'copies_at_destination': 0,  # Count duplicate deliveries
-            'unique_nodes_processed': set()  # Track all nodes that touched this packet
+            'copies_at_destination': int(del_copies.get(packet_seq, 0)),  # Count duplicate deliveries
+            'unique_nodes_processed': set()  # Filled from the bitmap below
         }
-        
-        for _, event in packet_events.iterrows():
+
+        # Dense uint8 bitmap instead of a hash set: marking a visited node
+        # is one array store, and the sorted unique list falls out of
+        # np.nonzero at the end. IDs outside the bitmap (none expected)
+        # still land in a spill set.
+        node_bitmap = np.zeros(_NODE_BITMAP_SIZE, np.uint8)
+        extra_nodes = set()
+
+        # O(1) membership for path_nodes; the list itself keeps the
+        # appearance order (and any repeated TX_SRC entries)
+        path_nodes_seen = {}
+
+        if generated_time is not None and delivered_time is not None:
+            transit = delivered_time - generated_time
+            path_info['first_transit_time'] = transit
+            path_info['transit_time'] = transit
+
+        # Iterate slices of the preconverted arrays instead of iterrows(),
+        # which boxes every cell into a per-row Series
+        n_events = hi - lo
+        vias = vias_all[lo:hi] if has_via else [None] * n_events
+        hop_types = hop_types_all[lo:hi] if has_hop_type else [None] * n_events
+
+        for sim_time, event_type, code, node, via, hop_type, ttl in zip(
+                sim_times_all[lo:hi],
+                events_all[lo:hi],
+                event_codes_all[lo:hi],
+                nodes_all[lo:hi],
+                vias,
+                hop_types,
+                ttls_all[lo:hi]):
             event_data = {
-                'time': event['simTime'],
-                'event_type': event['event'],
-                'node': event['currentNode'],
-                'next_hop': event.get('chosenVia', None),
-                'hop_type': event.get('nextHopType', None)
+                'time': sim_time,
+                'event_type': event_type,
+                'node': node,
+                'next_hop': via,
+                'hop_type': hop_type
             }
             path_info['path_events'].append(event_data)
-            
+
             # Track all unique nodes that processed this packet
-            try:
-                if not pd.isna(event['currentNode']):
-                    node_id = int(event['currentNode'])
-                    path_info['unique_nodes_processed'].add(node_id)
-            except Exception:
-                pass
-            
-            if event['event'] == 'TX_SRC':
-                path_info['source'] = event['src']
-                path_info['destination'] = event['dst']
-                path_info['generated_time'] = event['simTime']
-                path_info['path_nodes'].append(event['currentNode'])
-                try:
-                    path_info['initial_ttl'] = int(event['ttlAfterDecr']) if not pd.isna(event['ttlAfterDecr']) else None
-                except Exception:
-                    path_info['initial_ttl'] = None
-            
-            elif event['event'] in ['TX_FWD_DATA', 'TX_FWD_ACK']:
-                if event['currentNode'] not in path_info['path_nodes']:
-                    path_info['path_nodes'].append(event['currentNode'])
+            # (-1 is the preconversion sentinel for a missing node id)
+            if node >= 0:
+                if node < _NODE_BITMAP_SIZE:
+                    node_bitmap[node] = 1
+                else:
+                    extra_nodes.add(int(node))
+
+            if code == 0:  # TX_SRC
+                path_info['path_nodes'].append(node)
+                path_nodes_seen[node] = None
+
+            elif code == 1 or code == 2:  # TX_FWD_DATA / TX_FWD_ACK
+                if node not in path_nodes_seen:
+                    path_nodes_seen[node] = None
+                    path_info['path_nodes'].append(node)
                     path_info['hop_count'] += 1
-                
-                # Count unicast vs broadcast forwards
-                try:
-                    via = int(event['chosenVia']) if not pd.isna(event['chosenVia']) else None
-                    if via == 16777215:  # BROADCAST_ADDRESS
-                        path_info['broadcast_forwards'] += 1
-                    elif via is not None:
-                        path_info['unicast_forwards'] += 1
-                except Exception:
-                    pass
-            
-            elif event['event'] == 'DELIVERED':
-                path_info['delivered'] = True
-                path_info['copies_at_destination'] += 1  # Count each delivery
-                
-                # Only set time for first delivery
-                if path_info['delivered_time'] is None:
-                    path_info['delivered_time'] = event['simTime']
-                
-                if event['currentNode'] not in path_info['path_nodes']:
-                    path_info['path_nodes'].append(event['currentNode'])
-                
-                if path_info['generated_time'] is not None:
-                    transit = event['simTime'] - path_info['generated_time']
-                    
-                    if path_info['first_transit_time'] is None:
-                        path_info['first_transit_time'] = transit
-                        path_info['transit_time'] = transit
-                
-                # TTL-based hop count
-                try:
-                    ttl_at_delivery = int(event['ttlAfterDecr']) if not pd.isna(event['ttlAfterDecr']) else None
-                except Exception:
-                    ttl_at_delivery = None
-                
-                if path_info.get('initial_ttl') is not None and ttl_at_delivery is not None:
-                    hops = path_info['initial_ttl'] - ttl_at_delivery
+
+            elif code == 3:  # DELIVERED
+                if node not in path_nodes_seen:
+                    path_nodes_seen[node] = None
+                    path_info['path_nodes'].append(node)
+
+                if use_hop_kernel:
+                    continue  # TTL hop counts come from the kernel below
+
+                # TTL-based hop count (ttl == -1 means missing)
+                if initial_ttl is not None and ttl >= 0:
+                    hops = initial_ttl - int(ttl)
                     if hops >= 0:
                         path_info['deliver_hop_counts'].append(hops)
                         path_info['hop_count'] = hops
                         if path_info['first_hop_count'] is None:
                             path_info['first_hop_count'] = hops
+
+        if use_hop_kernel:
+            path_info['deliver_hop_counts'] = [int(h) for h in hops_buf[hop_offsets[g]:hop_offsets[g + 1]]]
+            if last_hops[g] >= 0:
+                path_info['hop_count'] = int(last_hops[g])
+            if first_hops[g] >= 0:
+                path_info['first_hop_count'] = int(first_hops[g])
         
-        # Convert set to sorted list and count
-        path_info['nodes_processed'] = sorted(list(path_info['unique_nodes_processed']))
-        path_info['unique_nodes_count'] = len(path_info['unique_nodes_processed'])
+        # Convert bitmap to sorted list and count
+        nodes = np.nonzero(node_bitmap)[0].tolist()
+        if extra_nodes:
+            nodes = sorted(set(nodes) | extra_nodes)
+        path_info['unique_nodes_processed'] = set(nodes)
+        path_info['nodes_processed'] = nodes
+        path_info['unique_nodes_count'] = len(nodes)
         packet_paths[packet_seq] = path_info
-    
+
+    # Columnar snapshot of the scalar per-packet fields: one pass here buys
+    # NumPy reductions everywhere downstream
+    n_packets = len(packet_paths)
+    infos = packet_paths.values()
+    packet_paths.stats = {
+        'delivered': np.fromiter((p['delivered'] for p in infos), dtype=bool, count=n_packets),
+        'transit_time': np.fromiter(
+            (p['transit_time'] if p['transit_time'] is not None else np.nan for p in infos),
+            dtype=np.float64, count=n_packets),
+        'unicast_forwards': np.fromiter((p['unicast_forwards'] for p in infos), dtype=np.int64, count=n_packets),
+        'broadcast_forwards': np.fromiter((p['broadcast_forwards'] for p in infos), dtype=np.int64, count=n_packets),
+        'copies_at_destination': np.fromiter((p['copies_at_destination'] for p in infos), dtype=np.int64, count=n_packets),
+    }
+
     return packet_paths
 
 def generate_dsdv_report(coordinates, extraction_info, df, packet_paths, rescue_speed, distance, total_energy, dsdv_timers, routing_protocol='dsdv', output_file=None):
@@ -601,262 +900,247 @@ def generate_dsdv_report(coordinates, extraction_info, df, packet_paths, rescue_
     if not os.path.isabs(output_file):
         output_file = os.path.join(reports_dir, output_file)
     
-    # Calculate statistics
-    total_generated = len(df[df['event'] == 'TX_SRC'])
-    total_delivered = len(df[df['event'] == 'DELIVERED'])
-    delivered_packets = [p for p in packet_paths.values() if p['delivered']]
-    
-    transit_times = []
-    for p in delivered_packets:
-        if p.get('transit_time') is not None:
-            transit_times.append(p['transit_time'])
-    
-    report_lines = []
-    report_lines.append("=" * 80)
-    
+    # Calculate statistics: count every event kind in one pass instead of
+    # one boolean-mask scan per kind
+    event_counts = df['event'].value_counts()
+    total_generated = int(event_counts.get('TX_SRC', 0))
+    total_delivered = int(event_counts.get('DELIVERED', 0))
+
+    stats = packet_paths.stats
+    transit_times = stats['transit_time'][~np.isnan(stats['transit_time'])]
+
+    # Derived values shared by several sections below; compute them once
+    # instead of re-deriving per section
+    delivery_rate = (total_delivered / total_generated) * 100 if total_generated > 0 else None
+    avg_transit = float(transit_times.mean()) if len(transit_times) else None
+
+    # Accumulate the report in a single StringIO instead of a list of line
+    # strings joined at the end; halves peak string memory for big reports
+    buf = io.StringIO()
+
+    def write_line(line):
+        buf.write(line)
+        buf.write('\n')
+
     # Determine report title based on protocol
     if routing_protocol == 'smart_flooding':
-        report_lines.append("SMART FLOODING RESCUE NODE MOBILITY ANALYSIS REPORT")
+        title = "SMART FLOODING RESCUE NODE MOBILITY ANALYSIS REPORT"
     elif routing_protocol == 'flooding':
-        report_lines.append("FLOODING RESCUE NODE MOBILITY ANALYSIS REPORT")
+        title = "FLOODING RESCUE NODE MOBILITY ANALYSIS REPORT"
     else:
-        report_lines.append("DSDV RESCUE NODE MOBILITY ANALYSIS REPORT")
-    
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_lines.append(f"Data Source: paths.csv ({len(df)} events)")
-    report_lines.append("")
-    
+        title = "DSDV RESCUE NODE MOBILITY ANALYSIS REPORT"
+
+    bar = "=" * 80
+    buf.write(f"{bar}\n{title}\n{bar}\n"
+              f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+              f"Data Source: paths.csv ({len(df)} events)\n\n")
+
     # SECTION 1: CONFIGURATION
-    report_lines.append("1. SIMULATION CONFIGURATION")
-    report_lines.append("-" * 50)
+    write_line("1. SIMULATION CONFIGURATION")
+    write_line("-" * 50)
     
     # Display protocol name based on detection
     if routing_protocol == 'smart_flooding':
-        report_lines.append(f"Routing Protocol: Smart Flooding (SMART_BROADCAST_SINGLE_SF)")
+        write_line(f"Routing Protocol: Smart Flooding (SMART_BROADCAST_SINGLE_SF)")
     elif routing_protocol == 'flooding':
-        report_lines.append(f"Routing Protocol: Flooding (Broadcast)")
+        write_line(f"Routing Protocol: Flooding (Broadcast)")
     else:
-        report_lines.append(f"Routing Protocol: DSDV (Destination-Sequenced Distance-Vector)")
-    report_lines.append(f"Mobility Model: Mobile rescue node")
+        write_line(f"Routing Protocol: DSDV (Destination-Sequenced Distance-Vector)")
+    write_line(f"Mobility Model: Mobile rescue node")
     
     if rescue_speed is not None:
         speed_source = extraction_info.get('speed_source', 'unknown')
-        report_lines.append(f"Rescue Node Speed: {rescue_speed:.1f} m/s (source: {speed_source})")
+        write_line(f"Rescue Node Speed: {rescue_speed:.1f} m/s (source: {speed_source})")
     else:
-        report_lines.append(f"Rescue Node Speed: Unknown (not found in configuration)")
+        write_line(f"Rescue Node Speed: Unknown (not found in configuration)")
     
-    report_lines.append("")
-    report_lines.append("Node Configuration:")
-    report_lines.append(f"  • End Node (1000): Stationary data source")
-    report_lines.append(f"  • Rescue Node (2000): Mobile destination")
-    report_lines.append("")
+    buf.write("\nNode Configuration:\n"
+              "  • End Node (1000): Stationary data source\n"
+              "  • Rescue Node (2000): Mobile destination\n\n")
     
     # DSDV Timer Configuration (only for DSDV protocol)
     if routing_protocol == 'dsdv' and dsdv_timers:
-        report_lines.append("DSDV Timer Settings:")
+        write_line("DSDV Timer Settings:")
         if dsdv_timers['relay_incremental'] is not None:
-            report_lines.append(f"  • Relay Nodes (loRaNodes):")
-            report_lines.append(f"    - Incremental update: {dsdv_timers['relay_incremental']:.0f}s")
+            write_line(f"  • Relay Nodes (loRaNodes):")
+            write_line(f"    - Incremental update: {dsdv_timers['relay_incremental']:.0f}s")
             if dsdv_timers['relay_full'] is not None:
-                report_lines.append(f"    - Full dump: {dsdv_timers['relay_full']:.0f}s")
+                write_line(f"    - Full dump: {dsdv_timers['relay_full']:.0f}s")
         
         if dsdv_timers['endnode_incremental'] is not None:
-            report_lines.append(f"  • End Nodes (loRaEndNodes):")
-            report_lines.append(f"    - Incremental update: {dsdv_timers['endnode_incremental']:.0f}s")
+            write_line(f"  • End Nodes (loRaEndNodes):")
+            write_line(f"    - Incremental update: {dsdv_timers['endnode_incremental']:.0f}s")
             if dsdv_timers['endnode_full'] is not None:
-                report_lines.append(f"    - Full dump: {dsdv_timers['endnode_full']:.0f}s")
+                write_line(f"    - Full dump: {dsdv_timers['endnode_full']:.0f}s")
         
         if dsdv_timers['rescue_incremental'] is not None:
-            report_lines.append(f"  • Rescue Nodes (loRaRescueNodes):")
-            report_lines.append(f"    - Incremental update: {dsdv_timers['rescue_incremental']:.0f}s")
+            write_line(f"  • Rescue Nodes (loRaRescueNodes):")
+            write_line(f"    - Incremental update: {dsdv_timers['rescue_incremental']:.0f}s")
             if dsdv_timers['rescue_full'] is not None:
-                report_lines.append(f"    - Full dump: {dsdv_timers['rescue_full']:.0f}s")
-    report_lines.append("")
+                write_line(f"    - Full dump: {dsdv_timers['rescue_full']:.0f}s")
+    write_line("")
     
     # SECTION 2: INITIAL POSITIONS AND DISTANCE
-    report_lines.append("2. INITIAL POSITIONS AND DISTANCE")
-    report_lines.append("-" * 50)
+    write_line("2. INITIAL POSITIONS AND DISTANCE")
+    write_line("-" * 50)
     
     if 1000 in coordinates and 2000 in coordinates:
-        report_lines.append(f"End Node (1000) position: ({coordinates[1000]['x']:.2f}, {coordinates[1000]['y']:.2f}) m")
-        report_lines.append(f"Rescue Node (2000) position: ({coordinates[2000]['x']:.2f}, {coordinates[2000]['y']:.2f}) m")
+        write_line(f"End Node (1000) position: ({coordinates[1000]['x']:.2f}, {coordinates[1000]['y']:.2f}) m")
+        write_line(f"Rescue Node (2000) position: ({coordinates[2000]['x']:.2f}, {coordinates[2000]['y']:.2f}) m")
         if distance is not None:
-            report_lines.append(f"Initial distance: {distance:.2f} meters")
+            write_line(f"Initial distance: {distance:.2f} meters")
     else:
-        report_lines.append("❌ Coordinate extraction failed")
+        write_line("❌ Coordinate extraction failed")
         if 1000 not in coordinates:
-            report_lines.append("  • End node (1000) coordinates not found")
+            write_line("  • End node (1000) coordinates not found")
         if 2000 not in coordinates:
-            report_lines.append("  • Rescue node (2000) coordinates not found")
+            write_line("  • Rescue node (2000) coordinates not found")
     
-    report_lines.append("")
+    write_line("")
     
     # SECTION 3: PACKET STATISTICS
-    report_lines.append("3. PACKET GENERATION AND DELIVERY")
-    report_lines.append("-" * 50)
-    report_lines.append(f"Packets generated: {total_generated}")
-    report_lines.append(f"Packets delivered: {total_delivered}")
-    
-    if total_generated > 0:
-        delivery_rate = (total_delivered / total_generated) * 100
-        report_lines.append(f"Delivery rate: {delivery_rate:.1f}% ({total_delivered}/{total_generated})")
+    buf.write(f"3. PACKET GENERATION AND DELIVERY\n{'-' * 50}\n"
+              f"Packets generated: {total_generated}\n"
+              f"Packets delivered: {total_delivered}\n")
+
+    if delivery_rate is not None:
+        write_line(f"Delivery rate: {delivery_rate:.1f}% ({total_delivered}/{total_generated})")
     
     # Copies received at destination
-    total_copies = sum(p.get('copies_at_destination', 0) for p in packet_paths.values())
-    report_lines.append(f"Total copies received at destination: {total_copies}")
+    total_copies = int(stats['copies_at_destination'].sum())
+    write_line(f"Total copies received at destination: {total_copies}")
     if total_delivered > 0:
         avg_copies = total_copies / total_delivered
-        report_lines.append(f"Average copies per delivered packet: {avg_copies:.2f}")
+        write_line(f"Average copies per delivered packet: {avg_copies:.2f}")
     
-    # Total unique nodes that processed packets
-    all_nodes_processed = set()
-    for p in packet_paths.values():
-        all_nodes_processed.update(p.get('nodes_processed', []))
-    report_lines.append(f"Total unique nodes that processed packets: {len(all_nodes_processed)}")
+    # Total unique nodes that processed packets; np.unique over one
+    # concatenated array dedups by sorting in C instead of hashing per node
+    node_arrays = [np.asarray(p['nodes_processed'], dtype=np.int64)
+                   for p in packet_paths.values() if p.get('nodes_processed')]
+    total_unique_nodes = np.unique(np.concatenate(node_arrays)).size if node_arrays else 0
+    write_line(f"Total unique nodes that processed packets: {total_unique_nodes}")
     
     # Energy consumption
     if total_energy is not None and total_energy > 0:
-        report_lines.append(f"")
-        report_lines.append(f"Total energy consumption: {total_energy:.6f} J (Joules)")
+        write_line(f"")
+        write_line(f"Total energy consumption: {total_energy:.6f} J (Joules)")
         if total_generated > 0:
             energy_per_packet = total_energy / total_generated
-            report_lines.append(f"Energy per generated packet: {energy_per_packet:.6f} J")
+            write_line(f"Energy per generated packet: {energy_per_packet:.6f} J")
         if total_delivered > 0:
             energy_per_delivered = total_energy / total_delivered
-            report_lines.append(f"Energy per delivered packet: {energy_per_delivered:.6f} J")
+            write_line(f"Energy per delivered packet: {energy_per_delivered:.6f} J")
     
-    report_lines.append("")
+    write_line("")
     
     # SECTION 4: ROUTING ANALYSIS
     if routing_protocol == 'smart_flooding':
-        report_lines.append("4. SMART FLOODING BEHAVIOR")
+        write_line("4. SMART FLOODING BEHAVIOR")
     elif routing_protocol == 'flooding':
-        report_lines.append("4. FLOODING BEHAVIOR")
+        write_line("4. FLOODING BEHAVIOR")
     else:
-        report_lines.append("4. DSDV ROUTING BEHAVIOR")
-    report_lines.append("-" * 50)
+        write_line("4. DSDV ROUTING BEHAVIOR")
+    write_line("-" * 50)
     
-    total_unicast = sum(p['unicast_forwards'] for p in packet_paths.values())
-    total_broadcast = sum(p['broadcast_forwards'] for p in packet_paths.values())
+    total_unicast = int(stats['unicast_forwards'].sum())
+    total_broadcast = int(stats['broadcast_forwards'].sum())
     
-    report_lines.append(f"Unicast forwards (routing table): {total_unicast}")
-    report_lines.append(f"Broadcast forwards: {total_broadcast}")
+    write_line(f"Unicast forwards (routing table): {total_unicast}")
+    write_line(f"Broadcast forwards: {total_broadcast}")
     
     if total_unicast > 0 or total_broadcast > 0:
         unicast_pct = (total_unicast / (total_unicast + total_broadcast)) * 100
-        report_lines.append(f"Unicast ratio: {unicast_pct:.1f}%")
+        write_line(f"Unicast ratio: {unicast_pct:.1f}%")
         
         if routing_protocol == 'dsdv':
-            if unicast_pct > 80:
-                report_lines.append("✓ EXCELLENT: High unicast ratio indicates effective DSDV routing")
-            elif unicast_pct > 50:
-                report_lines.append("✓ GOOD: Moderate unicast usage with DSDV routes")
-            else:
-                report_lines.append("⚠ WARNING: Low unicast ratio may indicate routing issues")
+            write_line(next(msg for thr, msg in _DSDV_UNICAST_BUCKETS if unicast_pct > thr))
         elif routing_protocol == 'smart_flooding':
-            if unicast_pct < 20:
-                report_lines.append("✓ EXPECTED: Low unicast ratio indicates broadcast-based flooding")
-            elif unicast_pct < 50:
-                report_lines.append("✓ GOOD: Smart flooding with some unicast optimization")
-            else:
-                report_lines.append("⚠ NOTE: High unicast ratio unusual for flooding protocol")
+            write_line(next(msg for thr, msg in _SMART_FLOODING_UNICAST_BUCKETS if unicast_pct < thr))
         else:  # flooding
             if total_broadcast > total_unicast:
-                report_lines.append("✓ EXPECTED: Broadcast-dominant forwarding for flooding protocol")
+                write_line("✓ EXPECTED: Broadcast-dominant forwarding for flooding protocol")
             else:
-                report_lines.append("⚠ NOTE: Unexpected unicast dominance in flooding protocol")
+                write_line("⚠ NOTE: Unexpected unicast dominance in flooding protocol")
     
-    report_lines.append("")
+    write_line("")
     
     # SECTION 5: INDIVIDUAL PACKET PATHS
-    report_lines.append("5. PACKET PATH DETAILS")
-    report_lines.append("-" * 50)
+    write_line("5. PACKET PATH DETAILS")
+    write_line("-" * 50)
     
+    # Hot loop: write each packet's block in a handful of batched writes
+    # instead of ~10 write_line dispatches per packet
+    write = buf.write
     for packet_seq, path in packet_paths.items():
-        report_lines.append(f"\nPacket {packet_seq}:")
-        report_lines.append(f"  Source: {path['source']} → Destination: {path['destination']}")
-        report_lines.append(f"  Generated: {path['generated_time']:.3f}s")
-        
+        write(f"\nPacket {packet_seq}:\n"
+              f"  Source: {path['source']} → Destination: {path['destination']}\n"
+              f"  Generated: {path['generated_time']:.3f}s\n")
+
         if path['delivered']:
-            report_lines.append(f"  ✓ Delivered: {path['delivered_time']:.3f}s")
+            write(f"  ✓ Delivered: {path['delivered_time']:.3f}s\n")
             if path['transit_time'] is not None:
-                report_lines.append(f"  Transit time: {path['transit_time']:.3f}s")
+                write(f"  Transit time: {path['transit_time']:.3f}s\n")
             if path['first_hop_count'] is not None:
-                report_lines.append(f"  Hop count: {path['first_hop_count'] + 1}")
-            report_lines.append(f"  Copies received at destination: {path.get('copies_at_destination', 0)}")
+                write(f"  Hop count: {path['first_hop_count'] + 1}\n")
+            write(f"  Copies received at destination: {path.get('copies_at_destination', 0)}\n")
         else:
-            report_lines.append(f"  ❌ Not delivered")
-        
-        report_lines.append(f"  Unicast forwards: {path['unicast_forwards']}")
-        report_lines.append(f"  Broadcast forwards: {path['broadcast_forwards']}")
-        report_lines.append(f"  Unique nodes processed: {path.get('unique_nodes_count', 0)}")
+            write("  ❌ Not delivered\n")
+
+        write(f"  Unicast forwards: {path['unicast_forwards']}\n"
+              f"  Broadcast forwards: {path['broadcast_forwards']}\n"
+              f"  Unique nodes processed: {path.get('unique_nodes_count', 0)}\n")
         if path.get('nodes_processed'):
-            report_lines.append(f"  Node IDs: {path['nodes_processed']}")
+            write(f"  Node IDs: {path['nodes_processed']}\n")
     
-    report_lines.append("")
+    write_line("")
     
     # SECTION 6: TRANSIT TIME STATISTICS
-    report_lines.append("6. TRANSIT TIME ANALYSIS")
-    report_lines.append("-" * 50)
-    
-    if transit_times:
-        report_lines.append(f"Delivered packets: {len(transit_times)}")
-        report_lines.append(f"Average transit time: {sum(transit_times)/len(transit_times):.3f}s")
-        report_lines.append(f"Minimum transit time: {min(transit_times):.3f}s")
-        report_lines.append(f"Maximum transit time: {max(transit_times):.3f}s")
-        
+    write_line("6. TRANSIT TIME ANALYSIS")
+    write_line("-" * 50)
+    
+    if len(transit_times):
+        write_line(f"Delivered packets: {len(transit_times)}")
+        write_line(f"Average transit time: {avg_transit:.3f}s")
+        write_line(f"Minimum transit time: {transit_times.min():.3f}s")
+        write_line(f"Maximum transit time: {transit_times.max():.3f}s")
+
         if len(transit_times) > 1:
-            import statistics
-            report_lines.append(f"Std deviation: {statistics.stdev(transit_times):.3f}s")
-            report_lines.append(f"Median: {statistics.median(transit_times):.3f}s")
+            # Sample standard deviation (ddof=1), matching statistics.stdev
+            write_line(f"Std deviation: {transit_times.std(ddof=1):.3f}s")
+            write_line(f"Median: {np.median(transit_times):.3f}s")
     else:
-        report_lines.append("No packets delivered - cannot calculate transit times")
+        write_line("No packets delivered - cannot calculate transit times")
     
-    report_lines.append("")
+    write_line("")
     
     # SECTION 7: PERFORMANCE SUMMARY
-    report_lines.append("7. PERFORMANCE ASSESSMENT")
-    report_lines.append("-" * 50)
+    write_line("7. PERFORMANCE ASSESSMENT")
+    write_line("-" * 50)
     
     if distance is not None:
-        report_lines.append(f"Network span: {distance:.1f}m (end node to rescue node)")
-    
-    if total_generated > 0:
-        delivery_rate = (total_delivered / total_generated) * 100
-        if delivery_rate >= 90:
-            report_lines.append("✓ EXCELLENT: Very high delivery rate")
-        elif delivery_rate >= 75:
-            report_lines.append("✓ GOOD: High delivery rate")
-        elif delivery_rate >= 50:
-            report_lines.append("⚠ FAIR: Moderate delivery rate")
-        else:
-            report_lines.append("❌ POOR: Low delivery rate")
+        write_line(f"Network span: {distance:.1f}m (end node to rescue node)")
     
-    if transit_times:
-        avg_transit = sum(transit_times) / len(transit_times)
-        if avg_transit < 2.0:
-            report_lines.append("✓ FAST: Quick network response")
-        elif avg_transit < 5.0:
-            report_lines.append("✓ GOOD: Reasonable response times")
-        else:
-            report_lines.append("⚠ SLOW: High latency")
+    if delivery_rate is not None:
+        write_line(next(msg for thr, msg in _DELIVERY_BUCKETS if delivery_rate >= thr))
+
+    if avg_transit is not None:
+        write_line(next(msg for thr, msg in _TRANSIT_BUCKETS if avg_transit < thr))
     
     # Protocol-specific assessment
     if routing_protocol == 'dsdv' and total_unicast > 0:
-        report_lines.append("✓ DSDV routing tables actively used for forwarding")
+        write_line("✓ DSDV routing tables actively used for forwarding")
     elif routing_protocol in ['flooding', 'smart_flooding'] and total_broadcast > 0:
-        report_lines.append(f"✓ {routing_protocol.replace('_', ' ').title()} protocol functioning as expected")
+        write_line(f"✓ {routing_protocol.replace('_', ' ').title()} protocol functioning as expected")
     
-    report_lines.append("")
-    report_lines.append("=" * 80)
-    report_lines.append("END OF REPORT")
-    report_lines.append("=" * 80)
+    buf.write(f"\n{bar}\nEND OF REPORT\n{bar}\n")
     
-    # Write report
+    # Write report: stream the buffer out in chunks rather than duplicating
+    # it with one giant getvalue() string. The file is only opened once the
+    # report is fully built, so a failed run never leaves a partial report.
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report_lines))
+        buf.seek(0)
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            shutil.copyfileobj(buf, f, 1 << 20)
         
         protocol_name = routing_protocol.replace('_', ' ').title()
         print(f"✓ {protocol_name} analysis complete! Report: {output_file}")
@@ -865,57 +1149,44 @@ def generate_dsdv_report(coordinates, extraction_info, df, packet_paths, rescue_
         print(f"ERROR writing report: {e}")
         return None
 
-def main():
-    """Main function with command-line interface."""
-    parser = argparse.ArgumentParser(description='DSDV Rescue Node Mobility Analysis')
-    parser.add_argument('--paths', default='delivered_packets/paths.csv',
-                       help='Path to paths.csv file')
-    parser.add_argument('--results-dir',
-                       help='Results directory with .sca files')
-    parser.add_argument('--config',
-                       help='INI configuration file path')
-    parser.add_argument('--output',
-                       help='Output report filename')
-    parser.add_argument('--verbose', action='store_true',
-                       help='Enable verbose output')
-    
-    args = parser.parse_args()
-    
-    # Check paths.csv
-    if not os.path.exists(args.paths):
-        print(f"ERROR: {args.paths} not found!")
-        return 1
-    
+def run_analysis(paths_csv, results_dir=None, config_file=None,
+                 output_file=None, verbose=False):
+    """
+    Run the full analysis pipeline: load paths.csv, extract configuration
+    from the results, analyze packet paths and write the report.
+    Returns a dict of the collected results, or None if loading failed.
+    Importable entry point; main() is only the CLI wrapper around this.
+    """
     # Load paths data
     try:
-        df = pd.read_csv(args.paths)
-        print(f"Loaded {len(df)} events from {args.paths}")
+        df = load_paths_csv(paths_csv)
+        print(f"Loaded {len(df)} events from {paths_csv}")
     except Exception as e:
         print(f"ERROR loading CSV: {e}")
-        return 1
-    
+        return None
+
     # Find results directory
-    results_dir = args.results_dir or find_latest_results_directory()
+    results_dir = results_dir or find_latest_results_directory()
     if not results_dir:
         print("WARNING: No results directory found")
-    
+
     # Extract rescue node speed
     print("Extracting rescue node speed...")
-    rescue_speed, speed_source = extract_rescue_node_speed(results_dir, args.config)
-    
+    rescue_speed, speed_source = extract_rescue_node_speed(results_dir, config_file)
+
     if rescue_speed is not None:
         print(f"  Rescue node speed: {rescue_speed:.1f} m/s (from {speed_source})")
     else:
         print(f"  WARNING: Could not determine rescue node speed")
-    
+
     # Extract coordinates
     print("Extracting node coordinates...")
     coordinates, extraction_info = extract_node_coordinates(results_dir, node_ids=[1000, 2000])
     extraction_info['speed_source'] = speed_source
-    
-    if args.verbose:
+
+    if verbose:
         print(f"Extraction info: {extraction_info}")
-    
+
     # Calculate distance
     distance = None
     if 1000 in coordinates and 2000 in coordinates:
@@ -925,12 +1196,12 @@ def main():
         print(f"  Initial distance: {distance:.1f} meters")
     else:
         print("  WARNING: Could not extract coordinates")
-    
+
     # Detect routing protocol
     print("Detecting routing protocol...")
-    routing_protocol = detect_routing_protocol(results_dir, args.config)
+    routing_protocol = detect_routing_protocol(results_dir, config_file)
     print(f"  Routing protocol: {routing_protocol.replace('_', ' ').title()}")
-    
+
     # Extract energy consumption
     print("Extracting energy consumption...")
     total_energy, energy_readings = extract_total_energy(results_dir)
@@ -938,28 +1209,51 @@ def main():
         print(f"  Total energy: {total_energy:.6f} J ({len(energy_readings)} readings)")
     else:
         print("  WARNING: Could not extract energy data")
-    
+
     # Extract DSDV timers (only for DSDV protocol)
     dsdv_timers = {}
     if routing_protocol == 'dsdv':
         print("Extracting DSDV timer configurations...")
-        dsdv_timers = extract_dsdv_timers(results_dir, args.config)
+        dsdv_timers = extract_dsdv_timers(results_dir, config_file)
         if any(v is not None for v in dsdv_timers.values()):
             print("  Timer settings extracted")
         else:
             print("  WARNING: Could not extract DSDV timer settings")
-    
+
     # Analyze packet paths
     print("Analyzing DSDV packet paths...")
     packet_paths = analyze_dsdv_packet_paths(df)
-    
+
     # Generate report
     report_file = generate_dsdv_report(
-        coordinates, extraction_info, df, packet_paths, 
-        rescue_speed, distance, total_energy, dsdv_timers, routing_protocol, args.output
+        coordinates, extraction_info, df, packet_paths,
+        rescue_speed, distance, total_energy, dsdv_timers, routing_protocol, output_file
     )
-    
-    # Console summary
+
+    return {
+        'df': df,
+        'rescue_speed': rescue_speed,
+        'speed_source': speed_source,
+        'coordinates': coordinates,
+        'extraction_info': extraction_info,
+        'distance': distance,
+        'routing_protocol': routing_protocol,
+        'total_energy': total_energy,
+        'energy_readings': energy_readings,
+        'dsdv_timers': dsdv_timers,
+        'packet_paths': packet_paths,
+        'report_file': report_file,
+    }
+
+def print_summary(result):
+    """Print the console quick summary for a run_analysis() result."""
+    df = result['df']
+    packet_paths = result['packet_paths']
+    rescue_speed = result['rescue_speed']
+    distance = result['distance']
+    total_energy = result['total_energy']
+    report_file = result['report_file']
+
     print("\n" + "="*50)
     print("QUICK SUMMARY:")
     if rescue_speed is not None:
@@ -967,8 +1261,9 @@ def main():
     if distance is not None:
         print(f"• Initial distance: {distance:.1f} m")
     
-    total_generated = len(df[df['event'] == 'TX_SRC'])
-    total_delivered = len(df[df['event'] == 'DELIVERED'])
+    event_counts = df['event'].value_counts()
+    total_generated = int(event_counts.get('TX_SRC', 0))
+    total_delivered = int(event_counts.get('DELIVERED', 0))
     print(f"• Packets: {total_delivered}/{total_generated} delivered")
     
     if total_generated > 0:
@@ -987,17 +1282,45 @@ def main():
     total_copies = sum(p.get('copies_at_destination', 0) for p in packet_paths.values())
     print(f"• Copies at destination: {total_copies}")
     
-    all_nodes = set()
-    for p in packet_paths.values():
-        all_nodes.update(p.get('nodes_processed', []))
-    print(f"• Unique nodes processed: {len(all_nodes)}")
+    node_arrays = [np.asarray(p['nodes_processed'], dtype=np.int64)
+                   for p in packet_paths.values() if p.get('nodes_processed')]
+    unique_node_count = np.unique(np.concatenate(node_arrays)).size if node_arrays else 0
+    print(f"• Unique nodes processed: {unique_node_count}")
     
     if total_energy is not None:
         print(f"• Total energy: {total_energy:.6f} J")
     
     if report_file:
         print(f"\n✓ Full report: {report_file}")
-    
+
+def main():
+    """Main function with command-line interface."""
+    parser = argparse.ArgumentParser(description='DSDV Rescue Node Mobility Analysis')
+    parser.add_argument('--paths', default='delivered_packets/paths.csv',
+                       help='Path to paths.csv file')
+    parser.add_argument('--results-dir',
+                       help='Results directory with .sca files')
+    parser.add_argument('--config',
+                       help='INI configuration file path')
+    parser.add_argument('--output',
+                       help='Output report filename')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Enable verbose output')
+
+    args = parser.parse_args()
+
+    # Check paths.csv
+    if not os.path.exists(args.paths):
+        print(f"ERROR: {args.paths} not found!")
+        return 1
+
+    result = run_analysis(args.paths, results_dir=args.results_dir,
+                          config_file=args.config, output_file=args.output,
+                          verbose=args.verbose)
+    if result is None:
+        return 1
+
+    print_summary(result)
     return 0
 
 if __name__ == "__main__":